@@ -13,7 +13,9 @@ Authentication Flow:
 """
 
 import os
+import sys
 import time
+import heapq
 import secrets
 import logging
 from typing import Optional
@@ -23,7 +25,7 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Represents an authenticated MCP session."""
     token: str
@@ -44,13 +46,19 @@ class SessionManager:
 
     def __init__(self):
         self._sessions: dict[str, Session] = {}
+        # (expires_at, token) min-heap so cleanup only touches expired sessions;
+        # entries for invalidated sessions are skipped when they surface
+        self._expiry_heap: list[tuple[float, str]] = []
         self._api_key: Optional[str] = None
+        self._api_key_bytes: bytes = b""
         self._session_expiry: int = 600  # 10 minutes default
         self._load_config()
 
     def _load_config(self):
         """Load configuration from environment."""
         self._api_key = os.getenv("MCP_API_KEY")
+        # Encoded once; compared as bytes so non-ASCII input can't raise
+        self._api_key_bytes = (self._api_key or "").encode()
         self._session_expiry = int(os.getenv("MCP_SESSION_EXPIRY_SECONDS", "600"))
 
         if not self._api_key:
@@ -78,7 +86,7 @@ class SessionManager:
             return False
 
         # Constant-time comparison to prevent timing attacks
-        return secrets.compare_digest(api_key, self._api_key)
+        return secrets.compare_digest(api_key.encode(), self._api_key_bytes)
 
     def create_session(
         self,
@@ -105,6 +113,11 @@ class SessionManager:
         # Generate secure session token
         token = f"sess_{secrets.token_urlsafe(32)}"
 
+        # Repeat callers share one string object across their sessions
+        caller_id = sys.intern(caller_id)
+        if user_name is not None:
+            user_name = sys.intern(user_name)
+
         now = time.time()
         session = Session(
             token=token,
@@ -117,6 +130,7 @@ class SessionManager:
         )
 
         self._sessions[token] = session
+        heapq.heappush(self._expiry_heap, (session.expires_at, token))
         logger.info(f"Created session for {caller_id}, expires in {self._session_expiry}s")
 
         return session
@@ -131,6 +145,7 @@ class SessionManager:
         Returns:
             Session if valid and not expired, None otherwise
         """
+        self._cleanup_expired()
         session = self._sessions.get(token)
 
         if not session:
@@ -164,15 +179,17 @@ class SessionManager:
     def _cleanup_expired(self):
         """Remove all expired sessions."""
         now = time.time()
-        expired = [
-            token for token, session in self._sessions.items()
-            if now > session.expires_at
-        ]
-        for token in expired:
-            del self._sessions[token]
+        heap = self._expiry_heap
+        expired = 0
+        while heap and now > heap[0][0]:
+            expires_at, token = heapq.heappop(heap)
+            session = self._sessions.get(token)
+            if session is not None and session.expires_at == expires_at:
+                del self._sessions[token]
+                expired += 1
 
         if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions")
+            logger.info(f"Cleaned up {expired} expired sessions")
 
     def get_active_sessions_count(self) -> int:
         """Get count of active (non-expired) sessions."""
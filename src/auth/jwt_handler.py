@@ -7,11 +7,13 @@ Independent of Firebase - used for web, voice agent, and API auth.
 
 import os
 import time
+import hashlib
 import logging
+import threading
 from typing import Optional, Literal
 from dataclasses import dataclass, asdict
 
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +22,12 @@ DEFAULT_SECRET_KEY = "beyond-the-club-secret-key-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_SECONDS = 3600  # 1 hour
 REFRESH_TOKEN_EXPIRE_SECONDS = 86400 * 7  # 7 days
+VERIFY_CACHE_MAX_SIZE = 10000  # Verified payloads kept per handler
 
 AuthType = Literal["password", "phone_only", "sms_otp"]
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenPayload:
     """JWT token payload."""
     user_id: str
@@ -42,6 +45,15 @@ class TokenPayload:
         return cls(**data)
 
 
+def _unverified_exp(token: str) -> Optional[int]:
+    """Read the exp claim without checking the signature (None if unreadable)."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return None
+    return exp if isinstance(exp, int) else None
+
+
 class JWTHandler:
     """
     Handles JWT token generation and validation.
@@ -72,6 +84,15 @@ class JWTHandler:
                 "Set JWT_SECRET_KEY environment variable in production!"
             )
 
+        # HMAC key built once; given a raw string, python-jose rebuilds it on every
+        # encode and first tries to parse it as a JWK set on every decode
+        self._key = jwk.construct(self.secret_key, ALGORITHM)
+
+        # Payloads of tokens that passed signature checks, keyed by token digest.
+        # Expiry is re-checked on every hit; failures are never cached.
+        self._verify_cache: dict[bytes, TokenPayload] = {}
+        self._verify_lock = threading.Lock()
+
     def create_access_token(
         self,
         user_id: str,
@@ -103,7 +124,7 @@ class JWTHandler:
             token_type="access"
         )
 
-        token = jwt.encode(payload.to_dict(), self.secret_key, algorithm=ALGORITHM)
+        token = jwt.encode(payload.to_dict(), self._key, algorithm=ALGORITHM)
         logger.debug(f"Created access token for user {user_id}, expires in {exp - now}s")
         return token
 
@@ -138,7 +159,7 @@ class JWTHandler:
             token_type="refresh"
         )
 
-        token = jwt.encode(payload.to_dict(), self.secret_key, algorithm=ALGORITHM)
+        token = jwt.encode(payload.to_dict(), self._key, algorithm=ALGORITHM)
         logger.debug(f"Created refresh token for user {user_id}, expires in {exp - now}s")
         return token
 
@@ -167,27 +188,42 @@ class JWTHandler:
         """
         Verify and decode a token.
 
+        Verified payloads are cached, so repeat calls for the same token skip
+        the signature check; expiry is still checked on every call.
+
         Args:
             token: JWT token string
 
         Returns:
             TokenPayload if valid, None if invalid or expired
         """
-        try:
-            data = jwt.decode(token, self.secret_key, algorithms=[ALGORITHM])
-            payload = TokenPayload.from_dict(data)
+        key = hashlib.sha256(token.encode()).digest()[:16]
+        payload = self._verify_cache.get(key)
 
-            # Check expiration
-            if payload.exp < int(time.time()):
-                logger.debug("Token expired")
+        if payload is None:
+            try:
+                data = jwt.decode(token, self._key, algorithms=[ALGORITHM])
+                payload = TokenPayload.from_dict(data)
+            except JWTError as e:
+                logger.debug(f"Token verification failed: {e}")
                 return None
 
-            return payload
-
-        except JWTError as e:
-            logger.debug(f"Token verification failed: {e}")
+        # Check expiration
+        if payload.exp < int(time.time()):
+            logger.debug("Token expired")
+            with self._verify_lock:
+                self._verify_cache.pop(key, None)
             return None
 
+        with self._verify_lock:
+            if key not in self._verify_cache:
+                if len(self._verify_cache) >= VERIFY_CACHE_MAX_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._verify_cache[next(iter(self._verify_cache))]
+                self._verify_cache[key] = payload
+
+        return payload
+
     def refresh_access_token(self, refresh_token: str) -> Optional[str]:
         """
         Create a new access token from a valid refresh token.
@@ -223,6 +259,11 @@ class JWTHandler:
         Returns:
             Expiration timestamp or None if invalid
         """
+        # Already past its exp: no need to check the signature to say None
+        exp = _unverified_exp(token)
+        if exp is not None and exp < int(time.time()):
+            return None
+
         payload = self.verify_token(token)
         return payload.exp if payload else None
 
@@ -236,4 +277,10 @@ class JWTHandler:
         Returns:
             True if expired or invalid, False if still valid
         """
+        # An expired token is "expired or invalid" whatever its signature,
+        # so only tokens that still look valid pay for verification
+        exp = _unverified_exp(token)
+        if exp is not None and exp < int(time.time()):
+            return True
+
         return self.verify_token(token) is None
@@ -5,6 +5,7 @@ Uses bcrypt for secure password hashing.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 import bcrypt
@@ -15,6 +16,11 @@ logger = logging.getLogger(__name__)
 # 12 is a good balance for 2024
 BCRYPT_ROUNDS = 12
 
+# Deletes every ASCII character except digits and "+" (C-level str.translate)
+_PHONE_STRIP_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in "0123456789+")
+)
+
 
 class PasswordHandler:
     """
@@ -99,11 +105,13 @@ class PasswordHandler:
             return True
 
 
+@lru_cache(maxsize=4096)
 def normalize_phone(phone: str) -> Optional[str]:
     """
     Normalize a phone number to a standard format.
 
     Removes spaces, dashes, parentheses and ensures it starts with +.
+    Results are memoized, since the same number is normalized on every lookup.
 
     Args:
         phone: Phone number in any format
@@ -120,7 +128,10 @@ def normalize_phone(phone: str) -> Optional[str]:
         return None
 
     # Remove all non-digit characters except +
-    cleaned = "".join(c for c in phone if c.isdigit() or c == "+")
+    cleaned = phone.translate(_PHONE_STRIP_TABLE)
+    if not cleaned.isascii():
+        # Rare non-ASCII input: fall back to the per-character filter
+        cleaned = "".join(c for c in cleaned if c.isdigit() or c == "+")
 
     # If doesn't start with +, assume Brazilian number
     if not cleaned.startswith("+"):
@@ -5,14 +5,19 @@ Stores users in a JSON file for simplicity.
 Can be replaced with a database in the future.
 """
 
-import json
+import os
 import logging
+import shutil
+import threading
+import time
 import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List
 from dataclasses import dataclass, asdict, field
 
+import orjson
+
 from .password import PasswordHandler, normalize_phone
 
 logger = logging.getLogger(__name__)
@@ -21,7 +26,21 @@ logger = logging.getLogger(__name__)
 DEFAULT_USERS_FILE = Path(__file__).parent.parent.parent / "data" / "users.json"
 
 
-@dataclass
+def _new_user_id() -> str:
+    """
+    Generate a time-ordered user ID (UUIDv7 layout).
+
+    48-bit millisecond timestamp followed by 74 random bits, formatted as a
+    regular UUID string so IDs sort by creation time and stay compatible
+    with existing uuid4 IDs.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF000 << 64) | 0x7000 << 64  # version 7
+    value = value & ~(0xC000 << 48) | 0x8000 << 48  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+@dataclass(slots=True)
 class User:
     """User data model."""
     user_id: str
@@ -42,12 +61,12 @@ class User:
     def from_dict(cls, data: dict) -> "User":
         # Handle missing fields gracefully
         return cls(
-            user_id=data.get("user_id", str(uuid.uuid4())),
+            user_id=data.get("user_id", _new_user_id()),
             phone=data["phone"],
             password_hash=data.get("password_hash"),
             name=data.get("name"),
             email=data.get("email"),
-            member_ids=data.get("member_ids", []),
+            member_ids=list(data.get("member_ids", [])),
             created_at=data.get("created_at", datetime.utcnow().isoformat()),
             updated_at=data.get("updated_at", datetime.utcnow().isoformat()),
             last_login=data.get("last_login"),
@@ -76,6 +95,18 @@ class UserStore:
         """
         self.file_path = file_path or DEFAULT_USERS_FILE
         self.password_handler = PasswordHandler()
+        # Parsed file contents and user_id -> phone index, reused while the
+        # file's version (inode, mtime, ctime, size) stays the same. The file is
+        # shared with other processes (bot, API and MCP servers), so it is
+        # stat'ed on every load, and every save replaces it with a new inode.
+        # The cached dicts are never changed in place: writers copy, save, and
+        # swap in the result, so readers can use them without copying.
+        self._users: dict[str, dict] = {}
+        self._phones_by_id: dict[str, str] = {}
+        self._file_version: Optional[tuple[int, int, int, int]] = None
+        # Guards the cache and every load-modify-save sequence (the store is
+        # shared by API worker threads)
+        self._lock = threading.RLock()
         self._ensure_file()
 
     def _ensure_file(self):
@@ -84,18 +115,61 @@ class UserStore:
         if not self.file_path.exists():
             self._save_all({})
 
+    @staticmethod
+    def _version(stat: os.stat_result) -> tuple[int, int, int, int]:
+        """Identify a file version, including same-size rewrites within one mtime tick."""
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+    def _cache(self, users: dict[str, dict], stat: os.stat_result):
+        """Remember parsed users for the file version described by stat."""
+        phones_by_id = {
+            data.get("user_id"): phone for phone, data in users.items()
+        }
+        with self._lock:
+            self._users = users
+            self._phones_by_id = phones_by_id
+            self._file_version = self._version(stat)
+
+    def _snapshot(self) -> tuple[dict[str, dict], dict[str, str]]:
+        """
+        Current users and user_id -> phone index (read-only; parsed again
+        only when the file changed).
+        """
+        with self._lock:
+            try:
+                with open(self.file_path, "rb") as f:
+                    stat = os.fstat(f.fileno())
+                    if self._version(stat) != self._file_version:
+                        self._cache(orjson.loads(f.read()), stat)
+            except (orjson.JSONDecodeError, FileNotFoundError):
+                self._users, self._phones_by_id = {}, {}
+                self._file_version = None
+            return self._users, self._phones_by_id
+
     def _load_all(self) -> dict[str, dict]:
-        """Load all users from file."""
-        try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
+        """Load all users from file, as a copy callers may modify and save."""
+        return dict(self._snapshot()[0])
 
     def _save_all(self, users: dict[str, dict]):
-        """Save all users to file."""
-        with open(self.file_path, "w") as f:
-            json.dump(users, f, indent=2, ensure_ascii=False)
+        """Save all users to file (atomically, via a temp file and os.replace)."""
+        tmp_path = self.file_path.with_name(f".{self.file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            try:
+                # Same layout as json.dump(indent=2, ensure_ascii=False), UTF-8 encoded
+                with open(tmp_path, "wb") as f:
+                    f.write(orjson.dumps(users, option=orjson.OPT_INDENT_2))
+                    f.flush()
+                    try:
+                        shutil.copymode(self.file_path, tmp_path)
+                    except FileNotFoundError:
+                        pass
+                    os.replace(tmp_path, self.file_path)
+                    stat = os.fstat(f.fileno())
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            self._cache(users, stat)
 
     def create_user(
         self,
@@ -121,33 +195,70 @@ class UserStore:
         Raises:
             ValueError: If phone is invalid or user already exists
         """
-        normalized_phone = normalize_phone(phone)
-        if not normalized_phone:
-            raise ValueError(f"Invalid phone number: {phone}")
-
-        users = self._load_all()
-
-        if normalized_phone in users:
-            raise ValueError(f"User with phone {normalized_phone} already exists")
-
-        password_hash = None
-        if password:
-            password_hash = self.password_handler.hash(password)
-
-        user = User(
-            user_id=str(uuid.uuid4()),
-            phone=normalized_phone,
-            password_hash=password_hash,
-            name=name,
-            email=email,
-            member_ids=member_ids or []
-        )
+        return self.create_users([{
+            "phone": phone,
+            "password": password,
+            "name": name,
+            "email": email,
+            "member_ids": member_ids,
+        }])[0]
+
+    def create_users(self, user_dicts: List[dict]) -> List[User]:
+        """
+        Create several users with a single file write.
 
-        users[normalized_phone] = user.to_dict()
-        self._save_all(users)
+        Every entry is validated before anything is hashed or saved, so a
+        bad entry leaves the store unchanged.
 
-        logger.info(f"Created user: {normalized_phone}")
-        return user
+        Args:
+            user_dicts: Dicts with create_user's arguments ("phone" required)
+
+        Returns:
+            Created User objects, in input order
+
+        Raises:
+            ValueError: If a phone is invalid, already exists or is repeated
+        """
+        users, _ = self._snapshot()
+
+        phones = []
+        for data in user_dicts:
+            normalized_phone = normalize_phone(data["phone"])
+            if not normalized_phone:
+                raise ValueError(f"Invalid phone number: {data['phone']}")
+            if normalized_phone in users or normalized_phone in phones:
+                raise ValueError(f"User with phone {normalized_phone} already exists")
+            phones.append(normalized_phone)
+
+        # Hash outside the lock (bcrypt is slow); the duplicate check is
+        # repeated under it before saving
+
+        created = []
+        for normalized_phone, data in zip(phones, user_dicts):
+            password_hash = None
+            if data.get("password"):
+                password_hash = self.password_handler.hash(data["password"])
+
+            created.append(User(
+                user_id=_new_user_id(),
+                phone=normalized_phone,
+                password_hash=password_hash,
+                name=data.get("name"),
+                email=data.get("email"),
+                member_ids=data.get("member_ids") or []
+            ))
+
+        with self._lock:
+            users = self._load_all()
+            for user in created:
+                if user.phone in users:
+                    raise ValueError(f"User with phone {user.phone} already exists")
+                users[user.phone] = user.to_dict()
+            self._save_all(users)
+
+        for user in created:
+            logger.info(f"Created user: {user.phone}")
+        return created
 
     def get_by_phone(self, phone: str) -> Optional[User]:
         """
@@ -163,7 +274,7 @@ class UserStore:
         if not normalized:
             return None
 
-        users = self._load_all()
+        users, _ = self._snapshot()
         data = users.get(normalized)
 
         if data:
@@ -180,10 +291,10 @@ class UserStore:
         Returns:
             User if found, None otherwise
         """
-        users = self._load_all()
-        for data in users.values():
-            if data.get("user_id") == user_id:
-                return User.from_dict(data)
+        users, phones_by_id = self._snapshot()
+        phone = phones_by_id.get(user_id)
+        if phone is not None and phone in users:
+            return User.from_dict(users[phone])
         return None
 
     def update_user(self, user: User) -> User:
@@ -199,14 +310,15 @@ class UserStore:
         Raises:
             ValueError: If user doesn't exist
         """
-        users = self._load_all()
+        with self._lock:
+            users = self._load_all()
 
-        if user.phone not in users:
-            raise ValueError(f"User {user.phone} not found")
+            if user.phone not in users:
+                raise ValueError(f"User {user.phone} not found")
 
-        user.updated_at = datetime.utcnow().isoformat()
-        users[user.phone] = user.to_dict()
-        self._save_all(users)
+            user.updated_at = datetime.utcnow().isoformat()
+            users[user.phone] = user.to_dict()
+            self._save_all(users)
 
         logger.debug(f"Updated user: {user.phone}")
         return user
@@ -261,12 +373,13 @@ class UserStore:
         Returns:
             Updated User object or None if not found
         """
-        user = self.get_by_phone(phone)
-        if not user:
-            return None
+        with self._lock:
+            user = self.get_by_phone(phone)
+            if not user:
+                return None
 
-        user.last_login = datetime.utcnow().isoformat()
-        return self.update_user(user)
+            user.last_login = datetime.utcnow().isoformat()
+            return self.update_user(user)
 
     def link_member(self, phone: str, member_id: int) -> User:
         """
@@ -282,15 +395,16 @@ class UserStore:
         Raises:
             ValueError: If user doesn't exist
         """
-        user = self.get_by_phone(phone)
-        if not user:
-            raise ValueError(f"User with phone {phone} not found")
+        with self._lock:
+            user = self.get_by_phone(phone)
+            if not user:
+                raise ValueError(f"User with phone {phone} not found")
 
-        if member_id not in user.member_ids:
-            user.member_ids.append(member_id)
-            return self.update_user(user)
+            if member_id not in user.member_ids:
+                user.member_ids.append(member_id)
+                return self.update_user(user)
 
-        return user
+            return user
 
     def unlink_member(self, phone: str, member_id: int) -> User:
         """
@@ -306,15 +420,16 @@ class UserStore:
         Raises:
             ValueError: If user doesn't exist
         """
-        user = self.get_by_phone(phone)
-        if not user:
-            raise ValueError(f"User with phone {phone} not found")
+        with self._lock:
+            user = self.get_by_phone(phone)
+            if not user:
+                raise ValueError(f"User with phone {phone} not found")
 
-        if member_id in user.member_ids:
-            user.member_ids.remove(member_id)
-            return self.update_user(user)
+            if member_id in user.member_ids:
+                user.member_ids.remove(member_id)
+                return self.update_user(user)
 
-        return user
+            return user
 
     def list_users(self, active_only: bool = True) -> List[User]:
         """
@@ -326,7 +441,7 @@ class UserStore:
         Returns:
             List of User objects
         """
-        users = self._load_all()
+        users, _ = self._snapshot()
         result = [User.from_dict(data) for data in users.values()]
 
         if active_only:
@@ -349,20 +464,24 @@ class UserStore:
         if not normalized:
             return False
 
-        users = self._load_all()
+        with self._lock:
+            users = self._load_all()
 
-        if normalized not in users:
-            return False
+            if normalized not in users:
+                return False
 
-        if hard_delete:
-            del users[normalized]
-            logger.info(f"Hard deleted user: {normalized}")
-        else:
-            users[normalized]["is_active"] = False
-            users[normalized]["updated_at"] = datetime.utcnow().isoformat()
-            logger.info(f"Soft deleted user: {normalized}")
+            if hard_delete:
+                del users[normalized]
+                logger.info(f"Hard deleted user: {normalized}")
+            else:
+                users[normalized] = {
+                    **users[normalized],
+                    "is_active": False,
+                    "updated_at": datetime.utcnow().isoformat(),
+                }
+                logger.info(f"Soft deleted user: {normalized}")
 
-        self._save_all(users)
+            self._save_all(users)
         return True
 
     def user_exists(self, phone: str) -> bool:
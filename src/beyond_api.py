@@ -2,26 +2,76 @@
 
 import httpx
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Sequence, Tuple
 from datetime import datetime
 from urllib.parse import quote
 
+from .rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
+# Max URLs whose last response is kept for conditional revalidation
+MAX_CONDITIONAL_CACHE_ENTRIES = 256
 
-@dataclass
+# Session lists are reused within the same SESSIONS_CACHE_SECONDS wall-clock window
+SESSIONS_CACHE_SECONDS = 10
+
+# Max concurrent requests issued by get_sessions_for_dates
+MAX_CONCURRENT_DATE_REQUESTS = 8
+
+# Connection pool for the shared client; sized for concurrent date requests
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+# Retries for failed connection attempts (not for HTTP error responses)
+HTTP_CONNECT_RETRIES = 3
+
+# Client-side token bucket for every request on a client from create_http_client()
+RATE_LIMIT_BURST = 20
+RATE_LIMIT_PER_SECOND = 10.0
+
+
+def create_http_client() -> httpx.Client:
+    """
+    Create the keep-alive HTTP client used for Beyond API calls.
+
+    HTTP/2 lets concurrent requests multiplex over one TLS connection. The
+    client can be shared between BeyondAPI and SMSAuth so they use one pool.
+    Requests pass through a token bucket, so concurrent lookups self-throttle
+    instead of hitting the server's rate limit.
+    """
+    limiter = RateLimiter(RATE_LIMIT_BURST, RATE_LIMIT_PER_SECOND)
+    return httpx.Client(
+        http2=True,
+        timeout=30.0,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            limits=HTTP_POOL_LIMITS,
+            retries=HTTP_CONNECT_RETRIES
+        ),
+        event_hooks={"request": [lambda request: limiter.acquire()]}
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class SportSession:
-    """Represents a sport session slot (generic for all sports)."""
+    """
+    Represents a sport session slot (generic for all sports).
+
+    Immutable and slotted: many are created per poll. The dict fields are
+    left out of the hash so sessions can be deduplicated in sets.
+    """
     id: str
     sport: str
     date: str
     time: str
-    attributes: Dict[str, str]  # e.g., {"level": "Iniciante1", "wave_side": "Lado_esquerdo"} or {"court": "Quadra_Saibro"}
+    attributes: Dict[str, str] = field(hash=False)  # e.g., {"level": "Iniciante1", "wave_side": "Lado_esquerdo"} or {"court": "Quadra_Saibro"}
     available_spots: int
     total_spots: int
     is_available: bool
-    raw_data: dict
+    raw_data: dict = field(hash=False)
 
     # Convenience properties for surf (backwards compatibility)
     @property
@@ -52,17 +102,32 @@ class SessionDate:
 class BeyondAPI:
     """Client for Beyond The Club API."""
 
-    def __init__(self, base_url: str, token_provider: Callable[[], str]):
+    def __init__(
+        self,
+        base_url: str,
+        token_provider: Callable[[], str],
+        client: Optional[httpx.Client] = None
+    ):
         """
         Initialize the API client.
 
         Args:
             base_url: The API base URL
             token_provider: A callable that returns a valid auth token
+            client: Optional shared HTTP client (e.g. SMSAuth.client); when
+                given, closing the API leaves it open for its owner
         """
         self.base_url = base_url
         self._get_token = token_provider
-        self._client = httpx.Client(timeout=30.0)
+        # One keep-alive client for every call, so requests reuse warm TLS connections
+        self._owns_client = client is None
+        self._client = client or create_http_client()
+        # url -> (validator headers, parsed payload) for conditional GETs
+        self._etag_cache: Dict[str, Tuple[Dict[str, str], Any]] = {}
+        # url -> sessions for the current time bucket (see SESSIONS_CACHE_SECONDS)
+        self._sessions_cache: Dict[str, List[SportSession]] = {}
+        self._sessions_cache_bucket = 0
+        self._cache_lock = threading.Lock()
 
     def _get_headers(self) -> dict:
         """Get headers for API requests."""
@@ -75,7 +140,47 @@ class BeyondAPI:
             "user-agent": "okhttp/4.12.0",
         }
 
-    def _build_tag_params(self, tags: List[str]) -> str:
+    def _get_json_conditional(self, url: str) -> Any:
+        """
+        GET a JSON payload, revalidating the previous response when possible.
+
+        Sends If-None-Match / If-Modified-Since from the last response for the
+        same URL; on 304 Not Modified the cached payload is returned without
+        downloading or parsing the body again.
+        """
+        headers = self._get_headers()
+        cached = self._etag_cache.get(url)
+        if cached:
+            headers.update(cached[0])
+
+        response = self._client.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            logger.debug("Not modified: %s", url)
+            return cached[1]
+        response.raise_for_status()
+
+        data = response.json()
+
+        validators = {}
+        etag = response.headers.get("etag")
+        if etag:
+            validators["if-none-match"] = etag
+        last_modified = response.headers.get("last-modified")
+        if last_modified:
+            validators["if-modified-since"] = last_modified
+
+        # Requests may run on several threads at once (see SessionMonitor)
+        with self._cache_lock:
+            self._etag_cache.pop(url, None)
+            if validators:
+                self._etag_cache[url] = (validators, data)
+                if len(self._etag_cache) > MAX_CONDITIONAL_CACHE_ENTRIES:
+                    # Dicts keep insertion order, so the first key is the oldest
+                    self._etag_cache.pop(next(iter(self._etag_cache)))
+
+        return data
+
+    def _build_tag_params(self, tags: Sequence[str]) -> str:
         """Build URL-encoded tag parameters."""
         return "&".join([f"tags={quote(tag)}" for tag in tags])
 
@@ -93,7 +198,7 @@ class BeyondAPI:
 
     def get_available_dates(
         self,
-        tags: List[str],
+        tags: Sequence[str],
         sport: str = "surf",
         # Legacy parameters for backwards compatibility
         level: Optional[str] = None,
@@ -117,17 +222,14 @@ class BeyondAPI:
         tag_params = self._build_tag_params(tags)
         full_url = f"{url}?{tag_params}"
 
-        response = self._client.get(full_url, headers=self._get_headers())
-        response.raise_for_status()
-
-        data = response.json()
-        logger.debug(f"Available dates for {sport} with tags {tags}: {data}")
+        data = self._get_json_conditional(full_url)
+        logger.debug("Available dates for %s with tags %s: %s", sport, tags, data)
         return data
 
     def get_sessions_for_date(
         self,
         date: str,
-        tags: List[str],
+        tags: Sequence[str],
         attributes: Dict[str, str],
         sport: str = "surf",
         # Legacy parameters for backwards compatibility
@@ -155,10 +257,17 @@ class BeyondAPI:
         tag_params = self._build_tag_params(tags)
         full_url = f"{url}?date={date}&{tag_params}"
 
-        response = self._client.get(full_url, headers=self._get_headers())
-        response.raise_for_status()
-
-        data = response.json()
+        # Repeat calls in the same time bucket (other members, retries) share one response
+        bucket = int(time.time() // SESSIONS_CACHE_SECONDS)
+        with self._cache_lock:
+            if bucket != self._sessions_cache_bucket:
+                self._sessions_cache.clear()
+                self._sessions_cache_bucket = bucket
+            cached = self._sessions_cache.get(full_url)
+        if cached is not None:
+            return list(cached)
+
+        data = self._get_json_conditional(full_url)
         sessions = []
 
         for item in data if isinstance(data, list) else data.get("sessions", []):
@@ -175,7 +284,53 @@ class BeyondAPI:
             )
             sessions.append(session)
 
-        return sessions
+        with self._cache_lock:
+            if bucket == self._sessions_cache_bucket:
+                self._sessions_cache[full_url] = sessions
+        return list(sessions)
+
+    def get_sessions_for_dates(
+        self,
+        dates: List[str],
+        tags: Sequence[str],
+        attributes: Dict[str, str],
+        sport: str = "surf"
+    ) -> Dict[str, List[SportSession]]:
+        """
+        Get available sessions for several dates concurrently.
+
+        Requests share the client's connection pool, with at most
+        MAX_CONCURRENT_DATE_REQUESTS in flight.
+
+        Args:
+            dates: Dates in YYYY-MM-DD format
+            tags: List of tags to filter by
+            attributes: Dict of attribute name -> value for the sessions
+            sport: Sport type
+
+        Returns:
+            Dict of date -> sessions, in the order of ``dates``. Dates whose
+            request fails are logged and left out.
+        """
+        def fetch(date: str) -> Optional[List[SportSession]]:
+            try:
+                return self.get_sessions_for_date(date, tags, attributes, sport=sport)
+            except Exception as e:
+                logger.error("Error getting %s sessions for date %s: %s", sport, date, e)
+                return None
+
+        if len(dates) <= 1:
+            results = [fetch(date) for date in dates]
+        else:
+            workers = min(MAX_CONCURRENT_DATE_REQUESTS, len(dates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(fetch, dates))
+
+        return {
+            date: sessions
+            for date, sessions in zip(dates, results)
+            if sessions is not None
+        }
 
     def book_session(
         self,
@@ -203,7 +358,7 @@ class BeyondAPI:
         response = self._client.post(url, json=payload, headers=headers)
         response.raise_for_status()
 
-        logger.info(f"Successfully booked {sport} session {session_id}")
+        logger.info("Successfully booked %s session %s", sport, session_id)
         return response.json()
 
     def get_member_preferences(self) -> dict:
@@ -332,14 +487,14 @@ class BeyondAPI:
             try:
                 error_data = response.json()
                 error_msg = error_data.get("error", {}).get("message", str(error_data))
-                logger.error(f"Booking failed: {error_msg}")
-                logger.error(f"Full error response: {error_data}")
+                logger.error("Booking failed: %s", error_msg)
+                logger.error("Full error response: %s", error_data)
             except Exception:
-                logger.error(f"Booking failed with status {response.status_code}: {response.text}")
+                logger.error("Booking failed with status %s: %s", response.status_code, response.text)
             response.raise_for_status()
 
         data = response.json()
-        logger.info(f"Successfully created {sport} booking for member {member_id}")
+        logger.info("Successfully created %s booking for member %s", sport, member_id)
 
         # API returns {"isFailure": false, "statusCode": 200, "value": {...}}
         if isinstance(data, dict) and "value" in data:
@@ -383,7 +538,7 @@ class BeyondAPI:
         response.raise_for_status()
 
         data = response.json()
-        logger.info(f"Successfully cancelled {sport} booking {voucher_code}")
+        logger.info("Successfully cancelled %s booking %s", sport, voucher_code)
 
         # API returns {"isFailure": false, "statusCode": 200, "value": {...}}
         if isinstance(data, dict) and "value" in data:
@@ -391,5 +546,6 @@ class BeyondAPI:
         return data
 
     def close(self):
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client (unless it is shared)."""
+        if self._owns_client:
+            self._client.close()
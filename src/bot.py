@@ -479,14 +479,16 @@ class BeyondBot:
         """Set up the API client and session monitor."""
         self.api = BeyondAPI(
             self.config.api_base_url,
-            self.firebase_auth.get_valid_token
+            self.firebase_auth.get_valid_token,
+            client=self.sms_auth.client
         )
         self.monitor = SessionMonitor(
             self.api,
             self.config.session,
             get_member_preferences=lambda mid: self.get_member_preferences(mid, self._current_sport),
             sport=self._current_sport,
-            sport_config=self.get_sport_config()
+            sport_config=self.get_sport_config(),
+            base_interval=self.config.bot.check_interval_seconds
         )
         logger.info(f"Bot initialized successfully for sport: {self._current_sport}")
 
@@ -566,16 +568,23 @@ class BeyondBot:
 
         try:
             while self._running:
+                # Only a check that completed paces the next one; after an
+                # error, the previous check's report would be stale
+                report = None
                 try:
                     booked = self.run_once()
+                    report = self.monitor.last_report
                     if booked > 0:
                         logger.info(f"Booked {booked} session(s) this check")
 
                 except Exception as e:
                     logger.error(f"Error during check: {e}")
 
-                logger.info(f"Next check in {interval} seconds...")
-                time.sleep(interval)
+                # Back off while checks keep coming up empty
+                next_interval = report.suggested_next_interval if report else interval
+
+                logger.info(f"Next check in {next_interval:g} seconds...")
+                time.sleep(next_interval)
 
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
@@ -0,0 +1,52 @@
+"""Client-side rate limiting for Beyond API requests."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens, refilled at ``refill_per_sec``. Each
+    acquire takes one token, blocking until one is available, so bursts of
+    concurrent requests are smoothed out instead of tripping server limits.
+    """
+
+    def __init__(self, capacity: int = 10, refill_per_sec: float = 2.0):
+        if capacity < 1 or refill_per_sec <= 0:
+            raise ValueError("capacity must be >= 1 and refill_per_sec > 0")
+
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if one is available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.refill_per_sec
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            wait = self._reserve()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
@@ -94,7 +94,8 @@ class ServiceContext:
 
         self.api = BeyondAPI(
             self.config.api_base_url,
-            self.firebase_auth.get_valid_token
+            self.firebase_auth.get_valid_token,
+            client=self.sms_auth.client
         )
         logger.info(f"API initialized for sport: {self.current_sport}")
 
@@ -1,9 +1,15 @@
 """Session monitoring and booking logic."""
 
 import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Optional, Set, Dict, Callable, Any
-from datetime import datetime, time
+from functools import lru_cache
+from typing import List, Optional, Set, FrozenSet, Dict, Callable, Any, Iterable, Iterator, Tuple
+from datetime import time
 from itertools import product
 
 from .beyond_api import BeyondAPI, SportSession
@@ -14,6 +20,123 @@ SurfSession = SportSession
 
 logger = logging.getLogger(__name__)
 
+# Max session IDs remembered as booked (globally and per member). Old sessions
+# are for past dates, so only the most recent bookings need to be tracked.
+MAX_BOOKED_HISTORY = 4096
+
+# Below this many booked IDs a plain hash lookup beats the Bloom pre-check
+BLOOM_MIN_BOOKED = 1024
+
+# Polling backs off up to base_interval * MAX_BACKOFF_FACTOR while checks come up empty
+MAX_BACKOFF_FACTOR = 16
+
+# Members searched concurrently in run_check_for_members (each runs its own API calls)
+MAX_CONCURRENT_MEMBER_CHECKS = 4
+
+# Dates fetched per batch when a search stops at its first match
+EARLY_EXIT_DATE_BATCH = 2
+
+# Base tags used when no sport config is set (legacy surf setup)
+_DEFAULT_BASE_TAGS = ("Surf", "Agendamento")
+
+# Shared stand-in for members that have not booked anything yet
+_EMPTY: FrozenSet[str] = frozenset()
+
+# Session/target times: "HH:MM", "HH:MM:SS" or "HH:MM AM/PM"
+_TIME_RE = re.compile(r"^(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?(?:\s*([AaPp])[Mm])?$")
+
+
+@lru_cache(maxsize=512)
+def _parse_time_cached(time_str: str) -> Optional[time]:
+    """
+    Parse a session/target time string, or return None if it is not a time.
+
+    Cached process-wide: only a handful of distinct slot times ("09:00",
+    "13:00", ...) show up across members and sports.
+    """
+    m = _TIME_RE.match(time_str) if isinstance(time_str, str) else None
+    if not m:
+        return None
+
+    hour = int(m[1])
+    meridiem = m[4]
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem in "Pp" else 0)
+
+    try:
+        return time(hour, int(m[2]), int(m[3] or 0))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _tags_for(base_tags: Tuple[str, ...], attribute_values: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Build API tags: sport base tags followed by attribute values."""
+    return (*base_tags, *attribute_values)
+
+
+def _date_set(dates: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Index YYYY-MM-DD target dates for O(1) lookup, ignoring blank entries."""
+    return frozenset(d for d in (dates or ()) if d)
+
+
+def _extract_dates(dates_data: Any) -> List[str]:
+    """
+    Normalize an available-dates response into a list of YYYY-MM-DD strings.
+
+    The API has returned a list of strings, a list of dicts with a "date" or
+    "availableDate" key, and a dict wrapping the list under "dates" or
+    "availableDates".
+    """
+    if isinstance(dates_data, list):
+        return [
+            date for date in (
+                item if isinstance(item, str)
+                else (item.get("date") or item.get("availableDate")) if isinstance(item, dict)
+                else None
+                for item in dates_data
+            ) if date
+        ]
+
+    if isinstance(dates_data, dict):
+        return dates_data.get("dates") or dates_data.get("availableDates") or []
+
+    return []
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter used as a fast "never booked" pre-check.
+
+    Uses a 64KB bit array with three probes sliced from the key's hash. Keys
+    cannot be removed, so IDs evicted from the booked LRU only leave false
+    positives behind, which fall through to the exact set check.
+    """
+
+    _SIZE_BITS = 1 << 19
+    _MASK = _SIZE_BITS - 1
+
+    def __init__(self):
+        self._bits = bytearray(self._SIZE_BITS >> 3)
+
+    def _probes(self, key: str):
+        h = hash(key)
+        return (h & self._MASK, (h >> 21) & self._MASK, (h >> 42) & self._MASK)
+
+    def add(self, key: str):
+        bits = self._bits
+        for p in self._probes(key):
+            bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for p in self._probes(key):
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
 
 @dataclass
 class BookingTarget:
@@ -42,6 +165,13 @@ class MemberBookingResult:
     error: Optional[str] = None
 
 
+@dataclass
+class CheckReport:
+    """Outcome of a check, used by the caller to pace the next one."""
+    sessions_found: int  # Matching sessions found (member searches may stop at the first)
+    suggested_next_interval: float
+
+
 class SessionMonitor:
     """Monitor and book sport sessions."""
 
@@ -51,27 +181,180 @@ class SessionMonitor:
         config: SessionConfig,
         get_member_preferences: Optional[Callable[[int], Any]] = None,
         sport: str = "surf",
-        sport_config: Optional[SportConfig] = None
+        sport_config: Optional[SportConfig] = None,
+        base_interval: float = 60.0
     ):
         self.api = api
         self.config = config
         self.sport = sport
         self.sport_config = sport_config
-        self._booked_sessions: Set[str] = set()
-        self._member_booked: Dict[int, Set[str]] = {}  # member_id -> set of session_ids
+        # Bounded LRU "sets" of booked session IDs (values are unused)
+        self._booked_sessions: "OrderedDict[str, None]" = OrderedDict()
+        self._member_booked: Dict[int, "OrderedDict[str, None]"] = {}  # member_id -> session_ids
+        # Every booked ID (global or per member) is added here, so a miss means "not booked"
+        self._booked_bloom = _BloomFilter()
         self._get_member_preferences = get_member_preferences
+        # Per-run caches of read-only lookups (None outside run_check*, see _run_scope).
+        # Entries are futures so concurrent member searches share in-flight requests.
+        self._dates_cache: Optional[Dict[Tuple, "Future[List[str]]"]] = None
+        self._sessions_cache: Optional[Dict[Tuple, "Future[Optional[List[SportSession]]]"]] = None
+        # Guards booked-session state and run-cache entries across worker threads
+        self._lock = threading.Lock()
+        self.base_interval = base_interval
+        self._consecutive_empty_checks = 0
+        self.last_report: Optional[CheckReport] = None
+        # (attributes, tags, label) per global-search combination; rebuilt if sport_config changes
+        self._combos: Optional[List[Tuple[Dict[str, str], Tuple[str, ...], str]]] = None
+        self._combos_sport_config: Optional[SportConfig] = None
+
+        # Config is fixed for the monitor's lifetime, so index target dates once
+        self._target_dates_set = _date_set(config.target_dates)
+        self._is_target_date = self._build_date_checker(self._target_dates_set)
+
+        # Hours to match (None = no hour filter) and a checker specialized for them
+        self._target_hours_set = self._build_hour_set(config.target_hours)
+        self._is_target_time = self._build_time_checker(self._target_hours_set)
+
+    @staticmethod
+    def _remember(booked: "OrderedDict[str, None]", session_id: str):
+        """Record a session ID in a booked LRU, evicting the oldest on overflow."""
+        booked[session_id] = None
+        booked.move_to_end(session_id)
+        if len(booked) > MAX_BOOKED_HISTORY:
+            booked.popitem(last=False)
+
+    def _add_booked(self, session_id: str, member_id: Optional[int] = None):
+        """Track a booked session globally and, if given, for a member."""
+        with self._lock:
+            self._booked_bloom.add(session_id)
+            self._remember(self._booked_sessions, session_id)
+            if member_id is not None:
+                member_booked = self._member_booked.setdefault(member_id, OrderedDict())
+                self._remember(member_booked, session_id)
+
+    def _record_check(self, sessions_found: int) -> CheckReport:
+        """Record a check outcome and compute the backoff for the next one."""
+        if sessions_found:
+            self._consecutive_empty_checks = 0
+        else:
+            self._consecutive_empty_checks += 1
+
+        factor = min(2 ** self._consecutive_empty_checks, MAX_BACKOFF_FACTOR)
+        self.last_report = CheckReport(
+            sessions_found=sessions_found,
+            suggested_next_interval=self.base_interval * factor
+        )
+        return self.last_report
+
+    @contextmanager
+    def _run_scope(self) -> Iterator[None]:
+        """Cache dates/sessions lookups for the duration of one check run."""
+        self._dates_cache = {}
+        self._sessions_cache = {}
+        try:
+            yield
+        finally:
+            self._dates_cache = None
+            self._sessions_cache = None
+
+    def _get_available_dates(self, tags: Tuple[str, ...]) -> List[str]:
+        """Get available dates for tags, reusing results within the current run."""
+        cache = self._dates_cache
+        if cache is None:
+            return _extract_dates(self.api.get_available_dates(tags, sport=self.sport))
+
+        key = (tuple(sorted(tags)), self.sport)
+        with self._lock:
+            entry = cache.get(key)
+            owner = entry is None
+            if owner:
+                entry = cache[key] = Future()
+
+        if owner:
+            try:
+                entry.set_result(_extract_dates(self.api.get_available_dates(tags, sport=self.sport)))
+            except Exception as e:
+                # Don't cache failures; waiting callers see the error, later ones retry
+                with self._lock:
+                    cache.pop(key, None)
+                entry.set_exception(e)
+
+        return entry.result()
+
+    def _get_sessions_for_dates(
+        self,
+        dates: List[str],
+        tags: Tuple[str, ...],
+        attributes: Dict[str, str]
+    ) -> List[List[SportSession]]:
+        """
+        Get session lists for dates (in order), reusing results within the current run.
+
+        Dates missing from the run cache are fetched in one concurrent batch;
+        dates whose request fails are left out.
+        """
+        cache = self._sessions_cache
+        if cache is None:
+            return list(self.api.get_sessions_for_dates(
+                dates, tags, attributes, sport=self.sport
+            ).values())
+
+        tags_key = tuple(sorted(tags))
+        attrs_key = frozenset(attributes.items())
+        entries = []
+        missing: Dict[str, Future] = {}
+        with self._lock:
+            for date in dates:
+                key = (date, tags_key, attrs_key, self.sport)
+                entry = cache.get(key)
+                if entry is None:
+                    entry = cache[key] = missing[date] = Future()
+                entries.append(entry)
+
+        if missing:
+            try:
+                fetched = self.api.get_sessions_for_dates(
+                    list(missing), tags, attributes, sport=self.sport
+                )
+            except Exception:
+                fetched = {}
+            for date, entry in missing.items():
+                sessions = fetched.get(date)
+                if sessions is None:
+                    # Failed dates are not cached, so a later lookup retries them
+                    with self._lock:
+                        cache.pop((date, tags_key, attrs_key, self.sport), None)
+                entry.set_result(sessions)
+
+        results = (entry.result() for entry in entries)
+        return [sessions for sessions in results if sessions is not None]
+
+    def _iter_sessions_for_dates(
+        self,
+        dates: List[str],
+        tags: Tuple[str, ...],
+        attributes: Dict[str, str],
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[SportSession]]:
+        """
+        Yield session lists for dates in order, fetching ``batch_size`` dates at a time.
 
-    def _build_tags(self, attributes: Dict[str, str]) -> List[str]:
+        With no batch size every date is fetched in one batch. Smaller batches
+        let a caller that stops early skip requests for the remaining dates.
+        """
+        step = batch_size or len(dates) or 1
+        for start in range(0, len(dates), step):
+            yield from self._get_sessions_for_dates(dates[start:start + step], tags, attributes)
+
+    def _build_tags(self, attributes: Dict[str, str]) -> Tuple[str, ...]:
         """Build API tags from sport config and attributes."""
         if self.sport_config:
-            tags = list(self.sport_config.base_tags)
+            base_tags = tuple(self.sport_config.base_tags)
         else:
             # Fallback for surf
-            tags = ["Surf", "Agendamento"]
+            base_tags = _DEFAULT_BASE_TAGS
 
-        # Add attribute values to tags
-        tags.extend(attributes.values())
-        return tags
+        return _tags_for(base_tags, tuple(attributes.values()))
 
     def _format_attributes(self, attributes: Dict[str, str]) -> str:
         """Format attributes for logging."""
@@ -79,144 +362,187 @@ class SessionMonitor:
 
     def _parse_time(self, time_str: str) -> Optional[time]:
         """Parse time string to time object."""
-        try:
-            # Try different formats
-            for fmt in ["%H:%M", "%H:%M:%S", "%I:%M %p"]:
-                try:
-                    return datetime.strptime(time_str, fmt).time()
-                except ValueError:
-                    continue
-            return None
-        except Exception:
+        return _parse_time_cached(time_str)
+
+    @staticmethod
+    def _build_hour_set(target_hours: Optional[List[str]]) -> Optional[FrozenSet[int]]:
+        """
+        Parse target hours ("HH:MM") into the set of hours to match.
+
+        Returns None when no hours are configured (accept any time). Targets
+        that cannot be parsed are ignored.
+        """
+        targets = [h for h in (target_hours or ()) if h]
+        if not targets:
             return None
+        return frozenset(t.hour for t in map(_parse_time_cached, targets) if t)
+
+    def _build_time_checker(
+        self,
+        hours_set: Optional[FrozenSet[int]]
+    ) -> Callable[[str], bool]:
+        """
+        Build a session-time predicate specialized for the target hours.
 
-    def _is_target_time(self, session_time: str) -> bool:
-        """Check if session time matches target hours."""
-        if not self.config.target_hours or self.config.target_hours == ['']:
+        Used as ``self._is_target_time``; the no-filter case collapses to a
+        constant so the per-session check does no work at all.
+        """
+        if hours_set is None:
             # No specific hours configured, accept all
-            return True
+            return lambda session_time: True
+
+        parse_time = _parse_time_cached
 
-        parsed_time = self._parse_time(session_time)
-        if not parsed_time:
-            logger.warning(f"Could not parse session time: {session_time}")
-            return True  # Accept if we can't parse
+        def is_target_time(session_time: str) -> bool:
+            parsed_time = parse_time(session_time)
+            if not parsed_time:
+                logger.warning("Could not parse session time: %s", session_time)
+                return True  # Accept if we can't parse
+            # Match by hour
+            return parsed_time.hour in hours_set
 
-        for target_hour in self.config.target_hours:
-            if not target_hour:
-                continue
-            target_time = self._parse_time(target_hour)
-            if target_time and parsed_time.hour == target_time.hour:
-                # Match by hour
-                return True
+        return is_target_time
 
-        return False
+    @staticmethod
+    def _build_date_checker(dates_set: FrozenSet[str]) -> Callable[[str], bool]:
+        """
+        Build a session-date predicate specialized for the target dates.
 
-    def _is_target_date(self, session_date: str) -> bool:
-        """Check if session date matches target dates."""
-        if not self.config.target_dates or self.config.target_dates == ['']:
+        Used as ``self._is_target_date``; returns a constant when no dates
+        are configured and the set's own ``__contains__`` otherwise.
+        """
+        if not dates_set:
             # No specific dates configured, accept all
-            return True
+            return lambda session_date: True
+        return dates_set.__contains__
 
-        return session_date in self.config.target_dates
+    @staticmethod
+    def _filter_dates(dates: List[str], dates_set: FrozenSet[str]) -> List[str]:
+        """Keep only dates in dates_set (an empty set accepts every date)."""
+        if not dates_set:
+            return dates
+        return list(filter(dates_set.__contains__, dates))
 
-    def _is_target_time_for_member(self, session_time: str, target_hours: List[str]) -> bool:
-        """Check if session time matches target hours for a member."""
-        if not target_hours or target_hours == ['']:
-            return True
+    def _match_sessions(
+        self,
+        sessions: List[SportSession],
+        booked: Any,
+        is_target_time: Callable[[str], bool]
+    ) -> List[SportSession]:
+        """Keep sessions that are open, not already booked and at a target hour."""
+        if len(self._booked_sessions) > BLOOM_MIN_BOOKED:
+            booked_bloom = self._booked_bloom
+            return [
+                s for s in sessions
+                if s.is_available
+                and not (s.id in booked_bloom and s.id in booked)
+                and is_target_time(s.time)
+            ]
+
+        return [
+            s for s in sessions
+            if s.is_available and s.id not in booked and is_target_time(s.time)
+        ]
+
+    def _scan(
+        self,
+        combos: Iterable[Tuple[Dict[str, str], Tuple[str, ...], str]],
+        dates_set: FrozenSet[str],
+        booked: Any,
+        is_target_time: Callable[[str], bool],
+        log_prefix: str = "",
+        batch_size: Optional[int] = None
+    ) -> Iterator[SportSession]:
+        """
+        Yield matching sessions for each (attributes, tags, label) combination in order.
 
-        parsed_time = self._parse_time(session_time)
-        if not parsed_time:
-            return True
+        Shared by the global and per-member searches. A combination whose
+        lookup fails is logged and skipped. Sessions are fetched lazily, so a
+        caller that stops iterating early skips the remaining requests.
+        """
+        for attributes, tags, attrs_str in combos:
+            try:
+                logger.info("%sChecking availability for %s", log_prefix, attrs_str)
 
-        for target_hour in target_hours:
-            if not target_hour:
-                continue
-            target_time = self._parse_time(target_hour)
-            if target_time and parsed_time.hour == target_time.hour:
-                return True
-        return False
-
-    def _is_target_date_for_member(self, session_date: str, target_dates: List[str]) -> bool:
-        """Check if session date matches target dates for a member."""
-        if not target_dates or target_dates == ['']:
-            return True
-        return session_date in target_dates
+                dates = self._get_available_dates(tags)
+
+                logger.info("%sFound %d available dates for %s", log_prefix, len(dates), attrs_str)
+
+                wanted = self._filter_dates(dates, dates_set)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Skipping %d dates not in target dates", len(dates) - len(wanted))
+
+                for sessions in self._iter_sessions_for_dates(wanted, tags, attributes, batch_size):
+                    matches = self._match_sessions(sessions, booked, is_target_time)
+                    if matches:
+                        self._log_matches(matches, log_prefix, attrs_str)
+                        yield from matches
+
+            except Exception as e:
+                logger.error("%sError checking %s: %s", log_prefix, attrs_str, e)
+
+    @staticmethod
+    def _log_matches(matches: List[SportSession], log_prefix: str, attrs_str: str):
+        """Log matching sessions once per date, with per-session detail at DEBUG."""
+        logger.info(
+            "%sFound %d available sessions on %s (%s)",
+            log_prefix, len(matches), matches[0].date, attrs_str
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for session in matches:
+                logger.debug(
+                    "%sFound: %s %s (%s) - %d spots",
+                    log_prefix, session.date, session.time, attrs_str,
+                    session.available_spots
+                )
 
     def find_sessions_for_member(
         self,
         member_id: int,
-        member_name: str
+        member_name: str,
+        early_exit: bool = False
     ) -> List[SportSession]:
-        """Find available sessions for a specific member using their preferences."""
+        """
+        Find available sessions for a specific member using their preferences.
+
+        Args:
+            member_id: Member to search sessions for
+            member_name: Member name (used for logging)
+            early_exit: If True, stop at the first matching session instead of
+                scanning every preference and date; dates are then fetched
+                EARLY_EXIT_DATE_BATCH at a time so later dates are not requested
+
+        Returns:
+            Matching sessions in preference order
+        """
         if not self._get_member_preferences:
             logger.warning("No preference getter configured, using global config")
             return self.find_available_sessions()
 
         prefs = self._get_member_preferences(member_id)
         if not prefs or not prefs.sessions:
-            logger.warning(f"No preferences for member {member_name}, skipping")
+            logger.warning("No preferences for member %s, skipping", member_name)
             return []
 
-        available_sessions = []
-        member_booked = self._member_booked.get(member_id, set())
-
         # Process sessions in priority order (first preference = highest priority)
-        for pref in prefs.sessions:
-            attributes = pref.attributes
-            tags = self._build_tags(attributes)
-            attrs_str = self._format_attributes(attributes)
-
-            try:
-                logger.info(f"[{member_name}] Checking {attrs_str}")
-
-                dates_data = self.api.get_available_dates(tags, sport=self.sport)
-
-                dates = []
-                if isinstance(dates_data, list):
-                    for item in dates_data:
-                        if isinstance(item, str):
-                            dates.append(item)
-                        elif isinstance(item, dict):
-                            date_val = item.get("date") or item.get("availableDate")
-                            if date_val:
-                                dates.append(date_val)
-                elif isinstance(dates_data, dict):
-                    dates = dates_data.get("dates", []) or dates_data.get("availableDates", [])
-
-                logger.info(f"[{member_name}] Found {len(dates)} dates for {attrs_str}")
-
-                for date in dates:
-                    if not self._is_target_date_for_member(date, prefs.target_dates):
-                        continue
-
-                    try:
-                        sessions = self.api.get_sessions_for_date(
-                            date, tags, attributes, sport=self.sport
-                        )
-
-                        for session in sessions:
-                            if not session.is_available:
-                                continue
-
-                            if session.id in member_booked:
-                                continue
-
-                            if not self._is_target_time_for_member(session.time, prefs.target_hours):
-                                continue
-
-                            logger.info(
-                                f"[{member_name}] Found: {date} {session.time} "
-                                f"({attrs_str}) - {session.available_spots} spots"
-                            )
-                            available_sessions.append(session)
-
-                    except Exception as e:
-                        logger.error(f"[{member_name}] Error getting sessions for {date}: {e}")
-
-            except Exception as e:
-                logger.error(f"[{member_name}] Error checking {attrs_str}: {e}")
-
-        return available_sessions
+        combos = (
+            (pref.attributes, self._build_tags(pref.attributes), self._format_attributes(pref.attributes))
+            for pref in prefs.sessions
+        )
+        found = self._scan(
+            combos,
+            dates_set=_date_set(prefs.target_dates),
+            booked=self._member_booked.get(member_id, _EMPTY),
+            is_target_time=self._build_time_checker(self._build_hour_set(prefs.target_hours)),
+            log_prefix=f"[{member_name}] ",
+            batch_size=EARLY_EXIT_DATE_BATCH if early_exit else None
+        )
+
+        if early_exit:
+            first = next(found, None)
+            found.close()
+            return [first] if first else []
+        return list(found)
 
     def book_session_for_member(
         self,
@@ -228,18 +554,15 @@ class SessionMonitor:
         try:
             attrs_str = self._format_attributes(session.attributes)
             logger.info(
-                f"[{member_name}] Booking: {session.date} {session.time} ({attrs_str})"
+                "[%s] Booking: %s %s (%s)", member_name, session.date, session.time, attrs_str
             )
 
             result = self.api.book_session(session.id, str(member_id), sport=self.sport)
 
             # Track booked session for this member
-            if member_id not in self._member_booked:
-                self._member_booked[member_id] = set()
-            self._member_booked[member_id].add(session.id)
-            self._booked_sessions.add(session.id)
+            self._add_booked(session.id, member_id)
 
-            logger.info(f"[{member_name}] Successfully booked session {session.id}!")
+            logger.info("[%s] Successfully booked session %s!", member_name, session.id)
             return MemberBookingResult(
                 member_id=member_id,
                 member_name=member_name,
@@ -248,7 +571,7 @@ class SessionMonitor:
             )
 
         except Exception as e:
-            logger.error(f"[{member_name}] Failed to book session {session.id}: {e}")
+            logger.error("[%s] Failed to book session %s: %s", member_name, session.id, e)
             return MemberBookingResult(
                 member_id=member_id,
                 member_name=member_name,
@@ -271,53 +594,74 @@ class SessionMonitor:
 
         Returns:
             List of booking results
+
+        Members are searched concurrently (up to MAX_CONCURRENT_MEMBER_CHECKS
+        at a time). Bookings are made one member at a time, in list order, as
+        each search finishes, so later members' searches overlap with booking.
+        A member listed more than once is only searched and booked once.
+
+        The outcome is also recorded in ``last_report`` for polling backoff.
         """
         results = []
+        sessions_found = 0
 
-        for member in members:
-            member_id = member["member_id"]
-            member_name = member["social_name"]
+        def find(member: Dict[str, Any]) -> List[SportSession]:
+            logger.info("Checking sessions for %s...", member["social_name"])
+            # Only the first match gets booked, so stop searching once found
+            return self.find_sessions_for_member(
+                member["member_id"], member["social_name"], early_exit=auto_book
+            )
+
+        # Members with the same preferences share dates/sessions lookups
+        with self._run_scope(), \
+                ThreadPoolExecutor(max_workers=MAX_CONCURRENT_MEMBER_CHECKS) as executor:
+            # Submit every search up front, keyed by member, so they run ahead of booking
+            searches: Dict[int, Tuple[str, "Future[List[SportSession]]"]] = {}
+            for member in members:
+                if member["member_id"] not in searches:
+                    searches[member["member_id"]] = (member["social_name"], executor.submit(find, member))
 
-            logger.info(f"Checking sessions for {member_name}...")
-            available = self.find_sessions_for_member(member_id, member_name)
+            for member_id, (member_name, search) in searches.items():
+                available = search.result()
 
-            if not available:
-                logger.info(f"[{member_name}] No matching sessions found")
-                continue
+                if not available:
+                    logger.info("[%s] No matching sessions found", member_name)
+                    continue
 
-            logger.info(f"[{member_name}] Found {len(available)} matching sessions")
+                logger.info("[%s] Found %d matching sessions", member_name, len(available))
+                sessions_found += len(available)
 
-            if auto_book:
-                # Book the first available (highest priority) session
-                session = available[0]
-                result = self.book_session_for_member(session, member_id, member_name)
-                results.append(result)
+                if auto_book:
+                    # Book the first available (highest priority) session
+                    session = available[0]
+                    result = self.book_session_for_member(session, member_id, member_name)
+                    results.append(result)
 
-                if result.success:
-                    logger.info(f"[{member_name}] Booked: {session.date} {session.time}")
-                else:
-                    logger.warning(f"[{member_name}] Failed to book: {session.date} {session.time}")
+                    if result.success:
+                        logger.info("[%s] Booked: %s %s", member_name, session.date, session.time)
+                    else:
+                        logger.warning("[%s] Failed to book: %s %s", member_name, session.date, session.time)
 
+        self._record_check(sessions_found)
         return results
 
-    def _generate_attribute_combinations(self) -> List[Dict[str, str]]:
-        """Generate all combinations of attributes for global config search."""
+    def _generate_attribute_combinations(self) -> Iterator[Dict[str, str]]:
+        """Yield every combination of attributes for the global config search."""
         if not self.sport_config:
             # Fallback for surf using legacy config
-            combinations = []
             for level in self.config.levels:
                 if not level:
                     continue
                 for wave_side in self.config.wave_sides:
                     if not wave_side:
                         continue
-                    combinations.append({"level": level, "wave_side": wave_side})
-            return combinations
+                    yield {"level": level, "wave_side": wave_side}
+            return
 
         # Use sport config to generate combinations
         attr_names = self.sport_config.get_attributes()
         if not attr_names:
-            return []
+            return
 
         # Get all options for each attribute
         options_per_attr = []
@@ -327,100 +671,62 @@ class SessionMonitor:
                 options_per_attr.append([(attr_name, opt) for opt in options])
 
         if not options_per_attr:
-            return []
+            return
 
-        # Generate all combinations
-        combinations = []
+        # Generate all combinations lazily
         for combo in product(*options_per_attr):
-            attr_dict = dict(combo)
-            combinations.append(attr_dict)
+            yield dict(combo)
 
-        return combinations
+    def _get_search_combos(self) -> Iterator[Tuple[Dict[str, str], Tuple[str, ...], str]]:
+        """
+        Yield attribute combinations with their tags and log label.
 
-    def find_available_sessions(self) -> List[SportSession]:
-        """Find all available sessions matching the configured criteria."""
-        available_sessions = []
+        The first pass streams combinations as they are generated, so lookups
+        start right away, and keeps them for later checks. They are rebuilt
+        when ``sport_config`` is replaced with a different configuration.
+        """
+        if self._combos is not None and self._combos_sport_config == self.sport_config:
+            yield from self._combos
+            return
 
+        sport_config = self.sport_config
+        combos = []
         for attributes in self._generate_attribute_combinations():
-            tags = self._build_tags(attributes)
-            attrs_str = self._format_attributes(attributes)
-
-            try:
-                logger.info(f"Checking availability for {attrs_str}")
-
-                # Get available dates
-                dates_data = self.api.get_available_dates(tags, sport=self.sport)
-
-                # Extract dates from response
-                dates = []
-                if isinstance(dates_data, list):
-                    for item in dates_data:
-                        if isinstance(item, str):
-                            dates.append(item)
-                        elif isinstance(item, dict):
-                            date_val = item.get("date") or item.get("availableDate")
-                            if date_val:
-                                dates.append(date_val)
-                elif isinstance(dates_data, dict):
-                    dates = dates_data.get("dates", []) or dates_data.get("availableDates", [])
-
-                logger.info(f"Found {len(dates)} available dates for {attrs_str}")
-
-                # Check each date
-                for date in dates:
-                    if not self._is_target_date(date):
-                        logger.debug(f"Skipping date {date} - not in target dates")
-                        continue
-
-                    try:
-                        sessions = self.api.get_sessions_for_date(
-                            date, tags, attributes, sport=self.sport
-                        )
-
-                        for session in sessions:
-                            if not session.is_available:
-                                continue
-
-                            if session.id in self._booked_sessions:
-                                logger.debug(f"Skipping already booked session {session.id}")
-                                continue
+            combo = (attributes, self._build_tags(attributes), self._format_attributes(attributes))
+            combos.append(combo)
+            yield combo
 
-                            if not self._is_target_time(session.time):
-                                logger.debug(f"Skipping session at {session.time} - not target hour")
-                                continue
+        # Only a fully consumed pass is cached
+        self._combos = combos
+        self._combos_sport_config = sport_config
 
-                            logger.info(
-                                f"Found available session: {date} {session.time} "
-                                f"({attrs_str}) - {session.available_spots} spots"
-                            )
-                            available_sessions.append(session)
-
-                    except Exception as e:
-                        logger.error(f"Error getting sessions for date {date}: {e}")
-
-            except Exception as e:
-                logger.error(f"Error checking {attrs_str}: {e}")
-
-        return available_sessions
+    def find_available_sessions(self) -> List[SportSession]:
+        """Find all available sessions matching the configured criteria."""
+        return list(self._scan(
+            self._get_search_combos(),
+            dates_set=self._target_dates_set,
+            booked=self._booked_sessions,
+            is_target_time=self._is_target_time
+        ))
 
     def book_session(self, session: SportSession) -> bool:
         """Attempt to book a session."""
         try:
             attrs_str = self._format_attributes(session.attributes)
             logger.info(
-                f"Attempting to book session: {session.date} {session.time} ({attrs_str})"
+                "Attempting to book session: %s %s (%s)", session.date, session.time, attrs_str
             )
 
             result = self.api.book_session(session.id, sport=self.sport)
 
-            self._booked_sessions.add(session.id)
-            logger.info(f"Successfully booked session {session.id}!")
-            logger.info(f"Booking result: {result}")
+            self._add_booked(session.id)
+            logger.info("Successfully booked session %s!", session.id)
+            logger.info("Booking result: %s", result)
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to book session {session.id}: {e}")
+            logger.error("Failed to book session %s: %s", session.id, e)
             return False
 
     def run_check(self, auto_book: bool = True) -> List[SportSession]:
@@ -432,27 +738,31 @@ class SessionMonitor:
 
         Returns:
             List of available sessions found
+
+        The outcome is also recorded in ``last_report`` for polling backoff.
         """
-        logger.info(f"Running session availability check for {self.sport}...")
+        logger.info("Running session availability check for %s...", self.sport)
 
-        available = self.find_available_sessions()
+        with self._run_scope():
+            available = self.find_available_sessions()
+        self._record_check(len(available))
 
         if not available:
             logger.info("No matching available sessions found")
             return []
 
-        logger.info(f"Found {len(available)} matching available sessions")
+        logger.info("Found %d matching available sessions", len(available))
 
         if auto_book:
             for session in available:
                 success = self.book_session(session)
                 if success:
-                    logger.info(f"Booked: {session.date} {session.time}")
+                    logger.info("Booked: %s %s", session.date, session.time)
                 else:
-                    logger.warning(f"Failed to book: {session.date} {session.time}")
+                    logger.warning("Failed to book: %s %s", session.date, session.time)
 
         return available
 
     def get_booked_sessions(self) -> Set[str]:
         """Get the set of session IDs that have been booked this run."""
-        return self._booked_sessions.copy()
+        return set(self._booked_sessions)
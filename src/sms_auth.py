@@ -2,8 +2,10 @@
 
 import httpx
 import logging
+from types import MappingProxyType
 from typing import Optional
 
+from .beyond_api import create_http_client
 from .firebase_auth import FirebaseAuth, FirebaseTokens
 
 logger = logging.getLogger(__name__)
@@ -12,23 +14,36 @@ logger = logging.getLogger(__name__)
 class SMSAuth:
     """Handle SMS-based authentication flow."""
 
-    def __init__(self, firebase_auth: FirebaseAuth, api_base_url: str):
+    def __init__(
+        self,
+        firebase_auth: FirebaseAuth,
+        api_base_url: str,
+        client: Optional[httpx.Client] = None
+    ):
         self.firebase_auth = firebase_auth
         self.api_base_url = api_base_url
-        self._client = httpx.Client(timeout=30.0)
+        self._owns_client = client is None
+        self._client = client or create_http_client()
         self._user_tokens: Optional[FirebaseTokens] = None
-
-    def _get_api_headers(self, bearer_token: str) -> dict:
-        """Get headers for API requests."""
-        return {
+        # Static request headers, built once; only authorization varies per call.
+        # Kept off the client itself because the client is shared with BeyondAPI.
+        self._header_template = MappingProxyType({
             "accept": "application/json",
             "accept-encoding": "gzip",
-            "authorization": f"Bearer {bearer_token}",
             "connection": "Keep-Alive",
             "content-type": "application/json",
             "host": "api.beyondtheclub.tech",
             "user-agent": "okhttp/4.12.0",
-        }
+        })
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP client used for Beyond API calls, for sharing with BeyondAPI."""
+        return self._client
+
+    def _get_api_headers(self, bearer_token: str) -> dict:
+        """Get headers for API requests."""
+        return {**self._header_template, "authorization": f"Bearer {bearer_token}"}
 
     def send_sms_code(self, phone_number: str, admin_token: str) -> bool:
         """Send SMS verification code to phone number."""
@@ -37,11 +52,11 @@ class SMSAuth:
         payload = {"phone": phone_number}
         headers = self._get_api_headers(admin_token)
 
-        logger.debug(f"Sending SMS request to {url} with phone: {phone_number}")
+        logger.debug("Sending SMS request to %s with phone: %s", url, phone_number)
         response = self._client.post(url, json=payload, headers=headers)
 
         if not response.is_success:
-            logger.error(f"SMS request failed: {response.status_code} - {response.text}")
+            logger.error("SMS request failed: %s - %s", response.status_code, response.text)
             # Check for rate limiting in response body
             try:
                 data = response.json()
@@ -53,7 +68,7 @@ class SMSAuth:
 
         response.raise_for_status()
 
-        logger.info(f"SMS code sent to {phone_number}")
+        logger.info("SMS code sent to %s", phone_number)
         return True
 
     def verify_sms_code(self, phone_number: str, code: str, admin_token: str) -> str:
@@ -70,14 +85,14 @@ class SMSAuth:
         response.raise_for_status()
 
         data = response.json()
-        logger.debug(f"verify-sms response: {data}")
+        logger.debug("verify-sms response: %s", data)
 
         # Response is wrapped in { "value": { "token": "..." } }
         value = data.get("value", data)
         custom_token = value.get("token")
 
         if not custom_token:
-            logger.error(f"verify-sms full response: {data}")
+            logger.error("verify-sms full response: %s", data)
             raise ValueError(f"No custom token in SMS verification response")
 
         logger.info("SMS verification successful")
@@ -106,5 +121,6 @@ class SMSAuth:
         return self._user_tokens is not None
 
     def close(self):
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client (unless it is shared)."""
+        if self._owns_client:
+            self._client.close()
@@ -0,0 +1,100 @@
+"""
+Pytest configuration for API endpoint tests.
+
+Provides authentication fixtures shared by the endpoint test modules.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.auth import User
+
+
+TEST_PHONE = "+5511999999999"
+
+# The signed-in user (auth_token is issued for it)
+_AUTH_USER = User(
+    user_id="user-123",
+    phone=TEST_PHONE,
+    name="Test User",
+    password_hash="hashed",
+    member_ids=[12345],
+    is_active=True
+)
+
+# Fixed Beyond token expiry (2030-01-01T00:00:00Z) for mocked Beyond tokens
+BEYOND_EXPIRES_AT = 1893456000
+
+
+@pytest.fixture(scope="session")
+def auth_token(jwt_handler, test_config) -> str:
+    """Access token for the standard test user, signed once per session."""
+    return jwt_handler.create_access_token(
+        user_id=_AUTH_USER.user_id,
+        phone=test_config["test_phone"],
+        auth_type="password"
+    )
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token) -> dict:
+    """Authorization header carrying the session access token."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture(scope="session")
+def beyond_expires_at() -> int:
+    """Fixed expiry timestamp for mocked Beyond tokens (endpoints echo it)."""
+    return BEYOND_EXPIRES_AT
+
+
+@pytest.fixture(scope="session")
+def _auth_sanity(jwt_handler, auth_token) -> None:
+    """
+    Check once that the session token verifies.
+
+    Authenticated tests depend on this, so a broken JWT setup errors them all
+    at setup with this one cause instead of failing each test differently.
+    """
+    payload = jwt_handler.verify_token(auth_token)
+    assert payload is not None, "session access token does not verify"
+    assert payload.user_id == _AUTH_USER.user_id
+
+
+@pytest.fixture(autouse=True)
+def _override_services(api_app, mock_services):
+    """Serve mock_services to every endpoint through FastAPI's dependency overrides."""
+    from api.deps import services_dep
+
+    api_app.dependency_overrides[services_dep] = lambda: mock_services
+    yield
+    api_app.dependency_overrides.pop(services_dep, None)
+
+
+@pytest.fixture
+def auth_user() -> User:
+    """The shared signed-in user; member_ids changes are undone after the test."""
+    original = list(_AUTH_USER.member_ids)
+    yield _AUTH_USER
+    _AUTH_USER.member_ids = original
+
+
+@pytest.fixture
+def authenticated(_auth_sanity, jwt_handler, mock_services, auth_headers, auth_user) -> dict:
+    """Make the mocked services accept auth_headers as the standard test user."""
+    # Endpoints verify the header with the real JWT handler (calls still recorded)
+    mock_services.jwt.verify_token.side_effect = jwt_handler.verify_token
+    mock_services.users.get_by_id.return_value = auth_user
+    return auth_headers
+
+
+@pytest.fixture(scope="session")
+def _authed_test_client(api_app, auth_headers) -> TestClient:
+    """TestClient that sends the session Authorization header by default."""
+    return TestClient(api_app, headers=auth_headers)
+
+
+@pytest.fixture
+def authed_client(_authed_test_client, authenticated) -> TestClient:
+    """Client signed in as the standard test user (mocks set up per test)."""
+    return _authed_test_client
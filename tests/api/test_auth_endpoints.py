@@ -5,158 +5,131 @@ Tests registration, login, token refresh, and user management.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
+from dataclasses import replace
+from types import SimpleNamespace
 
 from src.auth import User
 from src.services.user_auth_service import AuthResult, AuthTokens
 
 
+_SUCCESS_TOKENS = AuthTokens(
+    access_token="test_access_token",
+    refresh_token="test_refresh_token"
+)
+_NEW_USER = User(
+    user_id="new-user-id",
+    phone="+5511999999999",
+    name="New User",
+    password_hash="hashed",
+    member_ids=[],
+    is_active=True
+)
+_SUCCESS_RESULT = AuthResult(success=True, tokens=_SUCCESS_TOKENS, user=_NEW_USER)
+_LOGIN_RESULT = AuthResult(
+    success=True,
+    tokens=_SUCCESS_TOKENS,
+    user=User(
+        user_id="user-id",
+        phone="+5511999999999",
+        name="Test User",
+        password_hash="hashed",
+        member_ids=[],
+        is_active=True
+    )
+)
+
+
 class TestAuthRegistration:
     """Tests for user registration endpoints."""
 
     @pytest.mark.api
-    def test_register_success(self, api_client, mock_services):
-        """Test successful user registration."""
-        mock_services.user_auth.register.return_value = AuthResult(
-            success=True,
-            tokens=AuthTokens(
-                access_token="test_access_token",
-                refresh_token="test_refresh_token"
-            ),
-            user=User(
-                user_id="new-user-id",
-                phone="+5511999999999",
-                name="New User",
-                password_hash="hashed",
-                member_ids=[],
-                is_active=True
-            )
+    @pytest.mark.parametrize("phone,result,status,detail_substr", [
+        pytest.param(
+            "+5511999999999",
+            _SUCCESS_RESULT,
+            200, None,
+            id="success"
+        ),
+        pytest.param(
+            "+5511999999999",
+            AuthResult(success=False, error="Phone already registered"),
+            400, "already registered",
+            id="duplicate-phone"
+        ),
+        pytest.param(
+            "invalid",
+            AuthResult(success=False, error="Invalid phone format"),
+            400, None,
+            id="invalid-phone"
+        ),
+    ])
+    def test_register(self, api_client, mock_services, phone, result, status, detail_substr):
+        """Test registration outcomes map to the right status codes."""
+        mock_services.user_auth.register.return_value = result
+
+        response = api_client.post(
+            "/api/v1/auth/register",
+            json={
+                "phone": phone,
+                "password": "SecurePassword123!",
+                "name": "New User"
+            }
         )
 
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/register",
-                json={
-                    "phone": "+5511999999999",
-                    "password": "SecurePassword123!",
-                    "name": "New User"
-                }
-            )
-
-        assert response.status_code == 200
+        assert response.status_code == status
         data = response.json()
-        assert data["success"] is True
-        assert data["tokens"]["access_token"] is not None
-        assert data["user"]["phone"] == "+5511999999999"
-
-    @pytest.mark.api
-    def test_register_duplicate_phone(self, api_client, mock_services):
-        """Test registration with existing phone fails."""
-        mock_services.user_auth.register.return_value = AuthResult(
-            success=False,
-            error="Phone already registered"
-        )
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/register",
-                json={
-                    "phone": "+5511999999999",
-                    "password": "SecurePassword123!",
-                    "name": "New User"
-                }
-            )
-
-        assert response.status_code == 400
-        assert "already registered" in response.json()["detail"].lower()
-
-    @pytest.mark.api
-    def test_register_invalid_phone(self, api_client, mock_services):
-        """Test registration with invalid phone format."""
-        mock_services.user_auth.register.return_value = AuthResult(
-            success=False,
-            error="Invalid phone format"
-        )
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/register",
-                json={
-                    "phone": "invalid",
-                    "password": "SecurePassword123!",
-                    "name": "New User"
-                }
-            )
-
-        assert response.status_code == 400
+        if status == 200:
+            assert data["success"] is True
+            assert data["tokens"]["access_token"] is not None
+            assert data["user"]["phone"] == phone
+        elif detail_substr:
+            assert detail_substr in data["detail"].lower()
 
 
 class TestAuthLogin:
     """Tests for login endpoints."""
 
     @pytest.mark.api
-    def test_login_password_success(self, api_client, mock_services):
-        """Test successful password login."""
-        mock_services.user_auth.login_password.return_value = AuthResult(
-            success=True,
-            tokens=AuthTokens(
-                access_token="test_access_token",
-                refresh_token="test_refresh_token"
-            ),
-            user=User(
-                user_id="user-id",
-                phone="+5511999999999",
-                name="Test User",
-                password_hash="hashed",
-                member_ids=[],
-                is_active=True
-            )
+    @pytest.mark.parametrize("password,result,status,detail_substr", [
+        pytest.param(
+            "CorrectPassword",
+            _LOGIN_RESULT,
+            200, None,
+            id="success"
+        ),
+        pytest.param(
+            "WrongPassword",
+            AuthResult(success=False, error="Invalid phone or password"),
+            401, "invalid",
+            id="wrong-password"
+        ),
+    ])
+    def test_login_password(self, api_client, mock_services, password, result, status, detail_substr):
+        """Test password login outcomes map to the right status codes."""
+        mock_services.user_auth.login_password.return_value = result
+
+        response = api_client.post(
+            "/api/v1/auth/login",
+            json={
+                "phone": "+5511999999999",
+                "password": password
+            }
         )
 
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/login",
-                json={
-                    "phone": "+5511999999999",
-                    "password": "CorrectPassword"
-                }
-            )
-
-        assert response.status_code == 200
+        assert response.status_code == status
         data = response.json()
-        assert data["success"] is True
-        assert data["tokens"]["access_token"] is not None
-
-    @pytest.mark.api
-    def test_login_password_wrong_password(self, api_client, mock_services):
-        """Test login with wrong password."""
-        mock_services.user_auth.login_password.return_value = AuthResult(
-            success=False,
-            error="Invalid phone or password"
-        )
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/login",
-                json={
-                    "phone": "+5511999999999",
-                    "password": "WrongPassword"
-                }
-            )
-
-        assert response.status_code == 401
-        assert "invalid" in response.json()["detail"].lower()
+        if status == 200:
+            assert data["success"] is True
+            assert data["tokens"]["access_token"] is not None
+        else:
+            assert detail_substr in data["detail"].lower()
 
     @pytest.mark.api
     def test_login_phone_only_success(self, api_client, mock_services):
         """Test phone-only login for voice agents."""
         mock_services.user_auth.login_phone_only.return_value = AuthResult(
             success=True,
-            tokens=AuthTokens(
-                access_token="test_access_token",
-                refresh_token="test_refresh_token"
-            ),
+            tokens=_SUCCESS_TOKENS,
             user=User(
                 user_id="user-id",
                 phone="+5511999999999",
@@ -167,14 +140,13 @@ class TestAuthLogin:
             )
         )
 
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/login/phone",
-                json={
-                    "phone": "+5511999999999",
-                    "auto_create": False
-                }
-            )
+        response = api_client.post(
+            "/api/v1/auth/login/phone",
+            json={
+                "phone": "+5511999999999",
+                "auto_create": False
+            }
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -185,10 +157,7 @@ class TestAuthLogin:
         """Test phone-only login with auto-create."""
         mock_services.user_auth.login_phone_only.return_value = AuthResult(
             success=True,
-            tokens=AuthTokens(
-                access_token="test_access_token",
-                refresh_token="test_refresh_token"
-            ),
+            tokens=_SUCCESS_TOKENS,
             user=User(
                 user_id="new-user-id",
                 phone="+5511888888888",
@@ -199,14 +168,13 @@ class TestAuthLogin:
             )
         )
 
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/login/phone",
-                json={
-                    "phone": "+5511888888888",
-                    "auto_create": True
-                }
-            )
+        response = api_client.post(
+            "/api/v1/auth/login/phone",
+            json={
+                "phone": "+5511888888888",
+                "auto_create": True
+            }
+        )
 
         assert response.status_code == 200
         mock_services.graph.sync_user.assert_called_once()
@@ -226,136 +194,44 @@ class TestTokenRefresh:
             )
         )
 
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/refresh",
-                json={"refresh_token": "valid_refresh_token"}
-            )
+        response = api_client.post(
+            "/api/v1/auth/refresh",
+            json={"refresh_token": "valid_refresh_token"}
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert data["tokens"]["access_token"] == "new_access_token"
 
-    @pytest.mark.api
-    def test_refresh_token_expired(self, api_client, mock_services):
-        """Test refresh with expired token."""
-        mock_services.user_auth.refresh_token.return_value = AuthResult(
-            success=False,
-            error="Token expired"
-        )
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/refresh",
-                json={"refresh_token": "expired_token"}
-            )
-
-        assert response.status_code == 401
-
 
 class TestCurrentUser:
     """Tests for current user endpoint."""
 
     @pytest.mark.api
-    def test_get_me_authenticated(self, api_client, mock_services, jwt_handler, test_config):
+    def test_get_me_authenticated(self, authed_client, mock_services, test_config):
         """Test getting current user info."""
-        # Create a real token
-        token = jwt_handler.create_access_token(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            auth_type="password"
-        )
-
-        mock_services.jwt.verify_token.return_value = MagicMock(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            token_type="access"
-        )
-        mock_services.users.get_by_id.return_value = User(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            name="Test User",
-            password_hash="hashed",
-            member_ids=[12345],
-            is_active=True
-        )
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.get(
-                "/api/v1/auth/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
+        response = authed_client.get("/api/v1/auth/me")
 
         assert response.status_code == 200
         data = response.json()
         assert data["phone"] == test_config["test_phone"]
         assert data["name"] == "Test User"
 
-    @pytest.mark.api
-    def test_get_me_no_token(self, api_client, mock_services):
-        """Test accessing /me without token."""
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.get("/api/v1/auth/me")
-
-        assert response.status_code == 401
-
-    @pytest.mark.api
-    def test_get_me_invalid_token(self, api_client, mock_services):
-        """Test accessing /me with invalid token."""
-        mock_services.jwt.verify_token.return_value = None
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.get(
-                "/api/v1/auth/me",
-                headers={"Authorization": "Bearer invalid_token"}
-            )
-
-        assert response.status_code == 401
-
 
 class TestMemberLinking:
     """Tests for member linking endpoints."""
 
     @pytest.mark.api
-    def test_link_member_success(self, api_client, mock_services, jwt_handler, test_config):
+    def test_link_member_success(self, authed_client, mock_services, auth_user):
         """Test linking member to user."""
-        token = jwt_handler.create_access_token(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            auth_type="password"
-        )
-
-        mock_services.jwt.verify_token.return_value = MagicMock(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            token_type="access"
-        )
-        mock_services.users.get_by_id.return_value = User(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            name="Test User",
-            password_hash="hashed",
-            member_ids=[],
-            is_active=True
-        )
+        auth_user.member_ids = []  # not linked yet
         mock_services.user_auth.link_member_to_user.return_value = AuthResult(
             success=True,
-            user=User(
-                user_id="user-123",
-                phone=test_config["test_phone"],
-                name="Test User",
-                password_hash="hashed",
-                member_ids=[12345],
-                is_active=True
-            )
+            user=replace(auth_user, member_ids=[12345])
         )
 
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/link-member/12345",
-                headers={"Authorization": f"Bearer {token}"}
-            )
+        response = authed_client.post("/api/v1/auth/link-member/12345")
 
         assert response.status_code == 200
         mock_services.graph.link_user_to_member.assert_called_once()
@@ -365,116 +241,78 @@ class TestBeyondAuth:
     """Tests for Beyond API authentication endpoints."""
 
     @pytest.mark.api
-    def test_request_sms(self, api_client, mock_services, jwt_handler, test_config):
-        """Test requesting SMS verification."""
-        token = jwt_handler.create_access_token(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            auth_type="password"
+    def test_beyond_auth_flow(self, authed_client, mock_services, beyond_expires_at):
+        """Test request-sms, verify-sms and status on one authenticated client."""
+        mock_services.beyond_tokens.request_sms.return_value = "session_info_data"
+        mock_services.beyond_tokens.verify_sms.return_value = SimpleNamespace(
+            id_token="mock_id_token",
+            refresh_token="mock_refresh_token"
         )
+        mock_services.auth.initialize_with_tokens.return_value = True
+        mock_services.members.set_current_user.return_value = None
+        mock_services.beyond_tokens.get_valid_id_token.return_value = "mock_id_token"
+        mock_services.beyond_tokens.get_token.return_value = SimpleNamespace(expires_at=beyond_expires_at)
 
-        mock_services.jwt.verify_token.return_value = MagicMock(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            token_type="access"
+        response = authed_client.post(
+            "/api/v1/auth/beyond/request-sms",
+            json={"phone": "+5511999999999"}
         )
-        mock_services.users.get_by_id.return_value = User(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            name="Test User",
-            password_hash="hashed",
-            member_ids=[],
-            is_active=True
+        assert response.status_code == 200
+        assert "session_info" in response.json()
+
+        response = authed_client.post(
+            "/api/v1/auth/beyond/verify-sms",
+            json={
+                "phone": "+5511999999999",
+                "code": "123456",
+                "session_info": "session_data"
+            }
         )
-        mock_services.beyond_tokens.request_sms.return_value = "session_info_data"
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/beyond/request-sms",
-                json={"phone": "+5511999999999"},
-                headers={"Authorization": f"Bearer {token}"}
-            )
+        assert response.status_code == 200
 
+        response = authed_client.get("/api/v1/auth/beyond/status")
         assert response.status_code == 200
         data = response.json()
-        assert "session_info" in data
+        assert data["valid"] is True
+        assert data["expires_at"] == beyond_expires_at
 
-    @pytest.mark.api
-    def test_verify_sms(self, api_client, mock_services, jwt_handler, test_config):
-        """Test verifying SMS code."""
-        token = jwt_handler.create_access_token(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            auth_type="password"
-        )
 
-        mock_services.jwt.verify_token.return_value = MagicMock(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            token_type="access"
-        )
-        mock_services.users.get_by_id.return_value = User(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            name="Test User",
-            password_hash="hashed",
-            member_ids=[],
-            is_active=True
-        )
-        # Mock tokens returned from verify_sms
-        mock_tokens = MagicMock()
-        mock_tokens.id_token = "mock_id_token"
-        mock_tokens.refresh_token = "mock_refresh_token"
-        mock_services.beyond_tokens.verify_sms.return_value = mock_tokens
-        mock_services.auth.initialize_with_tokens.return_value = True
-        mock_services.members.set_current_user.return_value = None
+def _expired_refresh(services):
+    services.user_auth.refresh_token.return_value = AuthResult(
+        success=False,
+        error="Token expired"
+    )
 
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.post(
-                "/api/v1/auth/beyond/verify-sms",
-                json={
-                    "phone": "+5511999999999",
-                    "code": "123456",
-                    "session_info": "session_data"
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
 
-        assert response.status_code == 200
+def _invalid_access_token(services):
+    services.jwt.verify_token.return_value = None
 
-    @pytest.mark.api
-    def test_beyond_status(self, api_client, mock_services, jwt_handler, test_config):
-        """Test checking Beyond API status."""
-        token = jwt_handler.create_access_token(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            auth_type="password"
-        )
 
-        mock_services.jwt.verify_token.return_value = MagicMock(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            token_type="access"
-        )
-        mock_services.users.get_by_id.return_value = User(
-            user_id="user-123",
-            phone=test_config["test_phone"],
-            name="Test User",
-            password_hash="hashed",
-            member_ids=[],
-            is_active=True
-        )
-        mock_services.beyond_tokens.get_valid_id_token.return_value = "mock_id_token"
-        mock_token = MagicMock()
-        mock_token.expires_at = 9999999999
-        mock_services.beyond_tokens.get_token.return_value = mock_token
-
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.get(
-                "/api/v1/auth/beyond/status",
-                headers={"Authorization": f"Bearer {token}"}
-            )
+class TestUnauthorized:
+    """Tests for requests rejected with 401."""
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is True
+    @pytest.mark.api
+    @pytest.mark.parametrize("method,url,kwargs,mock_setup", [
+        pytest.param("GET", "/api/v1/auth/me", {}, None, id="me-no-token"),
+        pytest.param(
+            "GET", "/api/v1/auth/me",
+            {"headers": {"Authorization": "Bearer invalid_token"}},
+            _invalid_access_token,
+            id="me-invalid-token"
+        ),
+        pytest.param("GET", "/api/v1/members", {}, None, id="members-no-token"),
+        pytest.param(
+            "POST", "/api/v1/auth/refresh",
+            {"json": {"refresh_token": "expired_token"}},
+            _expired_refresh,
+            id="refresh-expired"
+        ),
+    ])
+    def test_unauthorized(self, api_client, mock_services, method, url, kwargs, mock_setup):
+        """Test that missing, invalid or expired credentials get 401."""
+        if mock_setup:
+            mock_setup(mock_services)
+
+        response = api_client.request(method, url, **kwargs)
+
+        assert response.status_code == 401
@@ -5,7 +5,6 @@ Tests health check and system status.
 """
 
 import pytest
-from unittest.mock import patch
 
 
 class TestHealthCheck:
@@ -34,8 +33,7 @@ class TestHealthCheck:
     @pytest.mark.api
     def test_system_status(self, api_client, mock_services):
         """Test /api/v1/system/status endpoint."""
-        with patch("api.deps.get_services", return_value=mock_services):
-            response = api_client.get("/api/v1/system/status")
+        response = api_client.get("/api/v1/system/status")
 
         assert response.status_code == 200
         data = response.json()
@@ -8,28 +8,37 @@ This module provides common fixtures for testing:
 - API and MCP clients
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import json
+import functools
 import tempfile
 from pathlib import Path
-from typing import Generator, AsyncGenerator
-from unittest.mock import MagicMock, AsyncMock, patch
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Generator, AsyncGenerator
+from unittest.mock import Mock
+from dataclasses import dataclass, field
 
 import pytest
+import pytest_asyncio
 import httpx
 from fastapi.testclient import TestClient
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Set test environment variables before imports
-os.environ["JWT_SECRET_KEY"] = "test_jwt_secret_key_for_testing_only_32bytes!"
-os.environ["MCP_API_KEY"] = "test_mcp_api_key_for_testing_only"
-os.environ["ENVIRONMENT"] = "test"
+# Test environment variables, set before imports (values already set win)
+TEST_ENV = {
+    "JWT_SECRET_KEY": "test_jwt_secret_key_for_testing_only_32bytes!",
+    "MCP_API_KEY": "test_mcp_api_key_for_testing_only",
+    "ENVIRONMENT": "test",
+}
+for _key, _value in TEST_ENV.items():
+    os.environ.setdefault(_key, _value)
 
-from src.auth import JWTHandler, UserStore, User, PasswordHandler, normalize_phone
+if TYPE_CHECKING:
+    from src.auth import JWTHandler, UserStore, User, PasswordHandler
 
 
 # =============================================================================
@@ -40,8 +49,8 @@ from src.auth import JWTHandler, UserStore, User, PasswordHandler, normalize_pho
 def test_config():
     """Test configuration values."""
     return {
-        "jwt_secret": "test_jwt_secret_key_for_testing_only_32bytes!",
-        "mcp_api_key": "test_mcp_api_key_for_testing_only",
+        "jwt_secret": os.environ["JWT_SECRET_KEY"],
+        "mcp_api_key": os.environ["MCP_API_KEY"],
         "test_phone": "+5511999999999",
         "test_password": "TestPassword123!",
         "test_user_name": "Test User",
@@ -52,15 +61,27 @@ def test_config():
 # JWT Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jwt_handler(test_config) -> JWTHandler:
-    """Create a JWTHandler with test secret."""
-    return JWTHandler(secret_key=test_config["jwt_secret"])
+    """
+    Create a JWTHandler with test secret (stateless, shared by the session).
+
+    ``create_access_token`` is memoized per argument set so identical calls
+    reuse the signed token. Cached tokens keep their original iat/exp, which
+    is fine while a test run stays well under the 1h default expiry.
+    """
+    from src.auth import JWTHandler
+
+    handler = JWTHandler(secret_key=test_config["jwt_secret"])
+    handler.create_access_token = functools.lru_cache(maxsize=32)(
+        handler.create_access_token
+    )
+    return handler
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_access_token(jwt_handler, test_config) -> str:
-    """Create a valid access token."""
+    """Create a valid access token (signed once per session)."""
     return jwt_handler.create_access_token(
         user_id="test-user-id-123",
         phone=test_config["test_phone"],
@@ -68,9 +89,9 @@ def valid_access_token(jwt_handler, test_config) -> str:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_refresh_token(jwt_handler, test_config) -> str:
-    """Create a valid refresh token."""
+    """Create a valid refresh token (signed once per session)."""
     return jwt_handler.create_refresh_token(
         user_id="test-user-id-123",
         phone=test_config["test_phone"],
@@ -78,9 +99,9 @@ def valid_refresh_token(jwt_handler, test_config) -> str:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token_pair(jwt_handler, test_config) -> dict:
-    """Create access and refresh token pair."""
+    """Create access and refresh token pair (signed once per session)."""
     access_token, refresh_token = jwt_handler.create_token_pair(
         user_id="test-user-id-123",
         phone=test_config["test_phone"],
@@ -109,31 +130,46 @@ def expired_token(jwt_handler, test_config) -> str:
 # User Store Fixtures
 # =============================================================================
 
-@pytest.fixture
-def temp_user_file() -> Generator[Path, None, None]:
-    """Create a temporary file for user storage."""
-    with tempfile.NamedTemporaryFile(
-        mode='w', suffix='.json', delete=False
-    ) as f:
-        json.dump({}, f)
-        temp_path = Path(f.name)
+# bcrypt's minimum work factor; production cost (12) makes every hash ~250ms
+TEST_BCRYPT_ROUNDS = 4
+
+
+@pytest.fixture(scope="session")
+def _user_file_path(tmp_path_factory) -> Path:
+    """Path for user storage, created once per session."""
+    return tmp_path_factory.mktemp("users") / "users.json"
 
-    yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+@pytest.fixture
+def temp_user_file(_user_file_path) -> Path:
+    """Temporary user storage file, reset to an empty store for each test."""
+    _user_file_path.write_bytes(b"{}")
+    return _user_file_path
 
 
 @pytest.fixture
 def user_store(temp_user_file) -> UserStore:
-    """Create a UserStore with temporary file."""
-    return UserStore(file_path=temp_user_file)
+    """Create a UserStore with temporary file (hashing at the fast test work factor)."""
+    from src.auth import UserStore, PasswordHandler
 
+    store = UserStore(file_path=temp_user_file)
+    store.password_handler = PasswordHandler(rounds=TEST_BCRYPT_ROUNDS)
+    return store
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def password_handler() -> PasswordHandler:
-    """Create a PasswordHandler."""
+    """Create a PasswordHandler (only holds the bcrypt rounds, shared by the session)."""
+    from src.auth import PasswordHandler
+
+    return PasswordHandler(rounds=TEST_BCRYPT_ROUNDS)
+
+
+@pytest.fixture(scope="session")
+def password_handler_prod_cost() -> PasswordHandler:
+    """Create a PasswordHandler at the production work factor (slow; use sparingly)."""
+    from src.auth import PasswordHandler
+
     return PasswordHandler()
 
 
@@ -152,7 +188,7 @@ def sample_user(user_store, test_config) -> User:
 # Mock Services
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockMember:
     """Mock member for testing."""
     member_id: int
@@ -163,7 +199,7 @@ class MockMember:
     limit: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockSlot:
     """Mock availability slot for testing."""
     date: str
@@ -174,15 +210,15 @@ class MockSlot:
     max_quantity: int
     package_id: str
     product_id: str
+    combo_key: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def combo_key(self) -> str:
-        return f"{self.level}|{self.wave_side}"
+    def __post_init__(self):
+        object.__setattr__(self, "combo_key", f"{self.level}|{self.wave_side}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_members() -> list:
-    """Sample members for testing."""
+    """Sample members for testing (immutable, shared by the session)."""
     return [
         MockMember(
             member_id=12345,
@@ -203,9 +239,9 @@ def mock_members() -> list:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_slots() -> list:
-    """Sample availability slots for testing."""
+    """Sample availability slots for testing (immutable, shared by the session)."""
     return [
         MockSlot(
             date="2026-01-10",
@@ -232,64 +268,29 @@ def mock_slots() -> list:
 
 @pytest.fixture
 def mock_services(mock_members, mock_slots):
-    """Create mock services container."""
-    services = MagicMock()
-
-    # Mock user auth service
-    services.user_auth = MagicMock()
-    services.user_auth.register = MagicMock()
-    services.user_auth.login_password = MagicMock()
-    services.user_auth.login_phone_only = MagicMock()
-    services.user_auth.refresh_token = MagicMock()
-    services.user_auth.get_user_by_phone = MagicMock(return_value=None)
-
-    # Mock member service
-    services.members = MagicMock()
-    services.members.get_members = MagicMock(return_value=mock_members)
-    services.members.get_member_by_id = MagicMock()
-    services.members.get_member_preferences = MagicMock(return_value=None)
-    services.members.set_member_preferences = MagicMock()
-    services.members.set_current_user = MagicMock()
-
-    # Mock availability service
-    services.availability = MagicMock()
-    services.availability.get_slots_from_cache = MagicMock(return_value=mock_slots)
-    services.availability.scan_availability = MagicMock()
-
-    # Mock booking service
-    services.bookings = MagicMock()
-    services.bookings.get_active_bookings = MagicMock(return_value=[])
-    services.bookings.create_booking = MagicMock()
-    services.bookings.cancel_booking = MagicMock()
-
-    # Mock monitor service
-    services.monitor = MagicMock()
-
-    # Mock graph service
-    services.graph = MagicMock()
-    services.graph.sync_user = MagicMock()
-    services.graph.sync_member = MagicMock()
-
-    # Mock beyond tokens
-    services.beyond_tokens = MagicMock()
-    services.beyond_tokens.get_valid_id_token = MagicMock(return_value="mock_token")
-    services.beyond_tokens.has_valid_token = MagicMock(return_value=True)
-
-    # Mock auth service
-    services.auth = MagicMock()
-    services.auth.initialize_with_tokens = MagicMock(return_value=True)
-    services.auth.is_authenticated = MagicMock(return_value=True)
-
-    # Mock JWT handler
-    services.jwt = MagicMock()
-
-    # Mock user store
-    services.users = MagicMock()
-
-    # Mock config
-    services.config = MagicMock()
-    services.config.sports = ["surf", "tennis"]
-
+    """
+    Create mock services container.
+
+    A plain ``Mock`` creates child services and methods lazily on first access,
+    so only the return values tests rely on are configured here. Tests still
+    set ``return_value`` and assert calls on those (and any unlisted method);
+    the constant stubs at the end are plain callables without call tracking.
+    """
+    services = Mock()
+    # Return values tests override or assert calls against
+    services.configure_mock(**{
+        "members.get_members.return_value": mock_members,
+        "members.get_member_preferences.return_value": None,
+        "bookings.get_active_bookings.return_value": [],
+        "beyond_tokens.get_valid_id_token.return_value": "mock_token",
+        "auth.initialize_with_tokens.return_value": True,
+        "config.sports": ["surf", "tennis"],
+    })
+    # Constant stubs no test inspects; plain callables skip call recording
+    services.user_auth.get_user_by_phone = lambda *args, **kwargs: None
+    services.availability.get_slots_from_cache = lambda *args, **kwargs: mock_slots
+    services.beyond_tokens.has_valid_token = lambda *args, **kwargs: True
+    services.auth.is_authenticated = lambda *args, **kwargs: True
     return services
 
 
@@ -297,59 +298,88 @@ def mock_services(mock_members, mock_slots):
 # API Client Fixtures
 # =============================================================================
 
-@pytest.fixture
+# One keep-alive pool for the session-scoped async clients
+ASYNC_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=100)
+
+
+@pytest.fixture(scope="session")
 def api_app():
     """Create FastAPI app for testing."""
     from api.main import app
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_client(api_app) -> TestClient:
-    """Create synchronous test client for API."""
+    """
+    Create synchronous test client for API, shared by the session.
+
+    Don't set per-test state (e.g. default headers) on it; use a dedicated
+    client like ``authenticated_client`` instead.
+    """
     return TestClient(api_app)
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_api_client(api_app) -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Create async test client for API."""
+    """
+    Create async test client for API, shared by the session.
+
+    Runs on the session event loop, which async tests share by default
+    (``asyncio_default_test_loop_scope`` in pytest.ini).
+    """
     async with httpx.AsyncClient(
-        app=api_app,
-        base_url="http://test"
+        transport=httpx.ASGITransport(app=api_app),
+        base_url="http://test",
+        limits=ASYNC_CLIENT_LIMITS
     ) as client:
         yield client
 
 
 @pytest.fixture
-def authenticated_client(api_client, valid_access_token) -> TestClient:
-    """Create authenticated test client."""
-    api_client.headers["Authorization"] = f"Bearer {valid_access_token}"
-    return api_client
+def authenticated_client(api_app, valid_access_token) -> TestClient:
+    """Create authenticated test client (separate from the shared api_client)."""
+    return TestClient(
+        api_app,
+        headers={"Authorization": f"Bearer {valid_access_token}"}
+    )
 
 
 # =============================================================================
 # MCP Client Fixtures
 # =============================================================================
 
-@pytest.fixture
-def mcp_app():
+@pytest.fixture(scope="session")
+def sse_server():
+    """The imported MCP SSE server module, for monkeypatching its attributes."""
+    import mcp_btc.sse_server as module
+    return module
+
+
+@pytest.fixture(scope="session")
+def mcp_app(sse_server):
     """Create MCP Starlette app for testing."""
-    from mcp_btc.sse_server import app
-    return app
+    return sse_server.app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mcp_client(mcp_app) -> TestClient:
-    """Create synchronous test client for MCP."""
+    """Create synchronous test client for MCP, shared by the session (pass headers per request)."""
     return TestClient(mcp_app)
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_mcp_client(mcp_app) -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Create async test client for MCP."""
+    """
+    Create async test client for MCP, shared by the session.
+
+    Runs on the session event loop, which async tests share by default
+    (``asyncio_default_test_loop_scope`` in pytest.ini).
+    """
     async with httpx.AsyncClient(
-        app=mcp_app,
-        base_url="http://test"
+        transport=httpx.ASGITransport(app=mcp_app),
+        base_url="http://test",
+        limits=ASYNC_CLIENT_LIMITS
     ) as client:
         yield client
 
@@ -365,59 +395,59 @@ def temp_data_dir() -> Generator[Path, None, None]:
         yield Path(temp_dir)
 
 
-@pytest.fixture
+# Sample Beyond API response data, shared by every test (read-only view; treat the nested lists as read-only too)
+MOCK_BEYOND_API_RESPONSE = MappingProxyType({
+    "members": [
+        {
+            "memberId": 12345,
+            "name": "Rafael Test",
+            "socialName": "Rafael",
+            "isTitular": True,
+            "usage": 2,
+            "limit": 10
+        }
+    ],
+    "availability": [
+        {
+            "date": "2026-01-10",
+            "intervals": [
+                {
+                    "time": "08:00",
+                    "slots": [
+                        {
+                            "level": "Intermediario2",
+                            "waveSide": "Lado_direito",
+                            "available": 3,
+                            "maxQuantity": 6
+                        }
+                    ]
+                }
+            ]
+        }
+    ]
+})
+
+
+@pytest.fixture(scope="session")
 def mock_beyond_api_response():
     """Sample Beyond API response data."""
-    return {
-        "members": [
-            {
-                "memberId": 12345,
-                "name": "Rafael Test",
-                "socialName": "Rafael",
-                "isTitular": True,
-                "usage": 2,
-                "limit": 10
-            }
-        ],
-        "availability": [
-            {
-                "date": "2026-01-10",
-                "intervals": [
-                    {
-                        "time": "08:00",
-                        "slots": [
-                            {
-                                "level": "Intermediario2",
-                                "waveSide": "Lado_direito",
-                                "available": 3,
-                                "maxQuantity": 6
-                            }
-                        ]
-                    }
-                ]
-            }
-        ]
-    }
+    return MOCK_BEYOND_API_RESPONSE
 
 
 # =============================================================================
 # Pytest Configuration
 # =============================================================================
 
+MARKERS = (
+    "unit: mark test as unit test",
+    "integration: mark test as integration test",
+    "api: mark test as API endpoint test",
+    "mcp: mark test as MCP endpoint test",
+    "slow: mark test as slow running",
+)
+
+
 def pytest_configure(config):
     """Configure pytest markers."""
-    config.addinivalue_line(
-        "markers", "unit: mark test as unit test"
-    )
-    config.addinivalue_line(
-        "markers", "integration: mark test as integration test"
-    )
-    config.addinivalue_line(
-        "markers", "api: mark test as API endpoint test"
-    )
-    config.addinivalue_line(
-        "markers", "mcp: mark test as MCP endpoint test"
-    )
-    config.addinivalue_line(
-        "markers", "slow: mark test as slow running"
-    )
+    for marker in MARKERS:
+        config.addinivalue_line("markers", marker)
@@ -1,55 +1,33 @@
 """
 Pytest configuration for MCP tests.
 
-Separate conftest to avoid import issues with main conftest.
+The environment, test_config and the MCP app/client fixtures come from
+tests/conftest.py; this module only adds MCP-specific test doubles and isolates the global
+session manager per test.
 """
 
-import os
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
-from starlette.testclient import TestClient
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import mcp_btc.auth
 
-# Set test environment variables before imports
-os.environ["JWT_SECRET_KEY"] = "test_jwt_secret_key_for_testing_only_32bytes!"
-os.environ["MCP_API_KEY"] = "test_mcp_api_key_for_testing_only"
-os.environ["ENVIRONMENT"] = "test"
 
-
-@pytest.fixture(scope="session")
-def test_config():
-    """Test configuration values."""
-    return {
-        "jwt_secret": "test_jwt_secret_key_for_testing_only_32bytes!",
-        "mcp_api_key": "test_mcp_api_key_for_testing_only",
-        "test_phone": "+5511999999999",
-        "test_password": "TestPassword123!",
-        "test_user_name": "Test User",
-    }
+@pytest.fixture(autouse=True)
+def fresh_session_manager(monkeypatch):
+    """Start each test with no global session manager (restored afterwards)."""
+    monkeypatch.setattr(mcp_btc.auth, "_session_manager", None)
 
 
 @pytest.fixture
-def mcp_app():
-    """Create MCP Starlette app for testing."""
-    from mcp_btc.sse_server import app
-    return app
+def api_key_required(monkeypatch, sse_server):
+    """Make the session manager report a configured API key."""
+    manager = SimpleNamespace(_api_key="configured_key")
+    monkeypatch.setattr(sse_server, "get_session_manager", lambda: manager)
+    return manager
 
 
 @pytest.fixture
-def mcp_client(mcp_app) -> TestClient:
-    """Create synchronous test client for MCP."""
-    return TestClient(mcp_app)
-
-
-def pytest_configure(config):
-    """Configure pytest markers."""
-    config.addinivalue_line(
-        "markers", "mcp: mark test as MCP endpoint test"
-    )
-    config.addinivalue_line(
-        "markers", "unit: mark test as unit test"
-    )
+def invalid_session_token(monkeypatch, sse_server):
+    """Make every session token fail validation."""
+    monkeypatch.setattr(sse_server, "validate_session_token", lambda token: None)
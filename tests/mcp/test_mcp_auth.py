@@ -4,9 +4,34 @@ Integration tests for MCP Server authentication.
 Tests session creation, validation, and SSE authentication.
 """
 
+import os
+
 import pytest
-from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Optional
+
+
+MCP_API_KEY = os.environ["MCP_API_KEY"]
+
+
+@dataclass
+class FakeSession:
+    """Session stand-in for the MCP auth handlers; override only what varies."""
+    token: str = "sess_test_token_12345"
+    expires_at: int = 9999999999
+    created_at: int = 9999999399
+    caller_id: str = "+5511999999999"
+    user_name: Optional[str] = "Test User"
+    has_beyond_token: bool = True
+    member_ids: list = field(default_factory=lambda: [12345])
+
+
+def _authenticated(session, message="Success"):
+    """Stand-in for the async authenticate_request that always succeeds."""
+    async def authenticate_request(api_key, caller_id):
+        return True, message, session
+    return authenticate_request
 
 
 class TestMCPHealth:
@@ -28,66 +53,37 @@ class TestMCPSessionCreation:
     """Tests for MCP session creation."""
 
     @pytest.mark.mcp
-    def test_create_session_without_api_key(self, mcp_client):
-        """Test session creation without API key fails."""
-        response = mcp_client.post(
-            "/auth/session",
-            json={"caller_id": "+5511999999999"}
-        )
-
-        # When MCP_API_KEY is set, should return 401
-        assert response.status_code == 401
+    @pytest.mark.parametrize("api_key,body,status,error", [
+        # When MCP_API_KEY is set, a missing key is rejected
+        pytest.param(None, {"caller_id": "+5511999999999"}, 401, None, id="no-api-key"),
+        pytest.param(MCP_API_KEY, {}, 400, "caller_id is required", id="no-caller-id"),
+        pytest.param(
+            "wrong_api_key", {"caller_id": "+5511999999999"}, 401, "Invalid API key",
+            id="invalid-api-key"
+        ),
+    ])
+    def test_create_session_errors(self, mcp_client, api_key, body, status, error):
+        """Test session creation fails without a valid API key and caller_id."""
+        headers = {"X-API-Key": api_key} if api_key else {}
+        response = mcp_client.post("/auth/session", headers=headers, json=body)
+
+        assert response.status_code == status
         data = response.json()
         assert "error" in data
+        if error:
+            assert error in data["error"]
 
     @pytest.mark.mcp
-    def test_create_session_without_caller_id(self, mcp_client, test_config):
-        """Test session creation without caller_id fails."""
-        response = mcp_client.post(
-            "/auth/session",
-            headers={"X-API-Key": test_config["mcp_api_key"]},
-            json={}
-        )
-
-        assert response.status_code == 400
-        data = response.json()
-        assert data["error"] == "caller_id is required"
+    def test_create_session_success(self, mcp_client, test_config, monkeypatch, sse_server):
+        """Test successful session creation."""
+        monkeypatch.setattr(sse_server, "authenticate_request", _authenticated(FakeSession()))
 
-    @pytest.mark.mcp
-    def test_create_session_invalid_api_key(self, mcp_client):
-        """Test session creation with invalid API key."""
         response = mcp_client.post(
             "/auth/session",
-            headers={"X-API-Key": "wrong_api_key"},
+            headers={"X-API-Key": test_config["mcp_api_key"]},
             json={"caller_id": "+5511999999999"}
         )
 
-        assert response.status_code == 401
-        data = response.json()
-        assert "Invalid API key" in data["error"]
-
-    @pytest.mark.mcp
-    def test_create_session_success(self, mcp_client, test_config):
-        """Test successful session creation."""
-        # Mock the authenticate_request function
-        with patch("mcp_btc.sse_server.authenticate_request") as mock_auth:
-            mock_session = MagicMock()
-            mock_session.token = "sess_test_token_12345"
-            mock_session.expires_at = 9999999999
-            mock_session.created_at = 9999999399
-            mock_session.caller_id = "+5511999999999"
-            mock_session.user_name = "Test User"
-            mock_session.has_beyond_token = True
-            mock_session.member_ids = [12345]
-
-            mock_auth.return_value = (True, "Success", mock_session)
-
-            response = mcp_client.post(
-                "/auth/session",
-                headers={"X-API-Key": test_config["mcp_api_key"]},
-                json={"caller_id": "+5511999999999"}
-            )
-
         assert response.status_code == 200
         data = response.json()
         assert "session_token" in data
@@ -96,25 +92,24 @@ class TestMCPSessionCreation:
         assert data["user"]["phone"] == "+5511999999999"
 
     @pytest.mark.mcp
-    def test_create_session_new_user(self, mcp_client, test_config):
+    def test_create_session_new_user(self, mcp_client, test_config, monkeypatch, sse_server):
         """Test session creation for new user (auto-created)."""
-        with patch("mcp_btc.sse_server.authenticate_request") as mock_auth:
-            mock_session = MagicMock()
-            mock_session.token = "sess_new_user_token"
-            mock_session.expires_at = 9999999999
-            mock_session.created_at = 9999999399
-            mock_session.caller_id = "+5511888888888"
-            mock_session.user_name = None  # New user, no name
-            mock_session.has_beyond_token = False
-            mock_session.member_ids = []
-
-            mock_auth.return_value = (True, "User created", mock_session)
-
-            response = mcp_client.post(
-                "/auth/session",
-                headers={"X-API-Key": test_config["mcp_api_key"]},
-                json={"caller_id": "+5511888888888"}
-            )
+        mock_session = FakeSession(
+            token="sess_new_user_token",
+            caller_id="+5511888888888",
+            user_name=None,  # New user, no name
+            has_beyond_token=False,
+            member_ids=[]
+        )
+        monkeypatch.setattr(
+            sse_server, "authenticate_request", _authenticated(mock_session, "User created")
+        )
+
+        response = mcp_client.post(
+            "/auth/session",
+            headers={"X-API-Key": test_config["mcp_api_key"]},
+            json={"caller_id": "+5511888888888"}
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -126,47 +121,30 @@ class TestMCPSessionValidation:
     """Tests for MCP session validation."""
 
     @pytest.mark.mcp
-    def test_validate_session_no_token(self, mcp_client):
-        """Test validation without token."""
-        response = mcp_client.get("/auth/validate")
+    @pytest.mark.parametrize("auth_header,error", [
+        pytest.param(None, "Missing Bearer token", id="no-token"),
+        pytest.param("Bearer invalid_token", None, id="invalid-token"),
+    ])
+    def test_validate_session_rejected(self, mcp_client, invalid_session_token, auth_header, error):
+        """Test validation without a token or with an invalid one."""
+        headers = {"Authorization": auth_header} if auth_header else {}
+        response = mcp_client.get("/auth/validate", headers=headers)
 
         assert response.status_code == 200
         data = response.json()
         assert data["valid"] is False
-        assert "Missing Bearer token" in data["error"]
+        if error:
+            assert error in data["error"]
 
     @pytest.mark.mcp
-    def test_validate_session_invalid_token(self, mcp_client):
-        """Test validation with invalid token."""
-        with patch("mcp_btc.sse_server.validate_session_token") as mock_validate:
-            mock_validate.return_value = None
-
-            response = mcp_client.get(
-                "/auth/validate",
-                headers={"Authorization": "Bearer invalid_token"}
-            )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-
-    @pytest.mark.mcp
-    def test_validate_session_valid_token(self, mcp_client):
+    def test_validate_session_valid_token(self, mcp_client, monkeypatch, sse_server):
         """Test validation with valid token."""
-        with patch("mcp_btc.sse_server.validate_session_token") as mock_validate:
-            mock_session = MagicMock()
-            mock_session.caller_id = "+5511999999999"
-            mock_session.user_name = "Test User"
-            mock_session.has_beyond_token = True
-            mock_session.member_ids = [12345]
-            mock_session.expires_at = 9999999999
-
-            mock_validate.return_value = mock_session
+        monkeypatch.setattr(sse_server, "validate_session_token", lambda token: FakeSession())
 
-            response = mcp_client.get(
-                "/auth/validate",
-                headers={"Authorization": "Bearer sess_valid_token"}
-            )
+        response = mcp_client.get(
+            "/auth/validate",
+            headers={"Authorization": "Bearer sess_valid_token"}
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -185,15 +163,15 @@ class TestMCPSessionLogout:
         assert response.status_code == 401
 
     @pytest.mark.mcp
-    def test_logout_success(self, mcp_client):
+    def test_logout_success(self, mcp_client, monkeypatch, sse_server):
         """Test successful logout."""
-        with patch("mcp_btc.sse_server.get_session_manager") as mock_manager:
-            mock_manager.return_value.invalidate_session.return_value = True
+        manager = SimpleNamespace(invalidate_session=lambda token: True)
+        monkeypatch.setattr(sse_server, "get_session_manager", lambda: manager)
 
-            response = mcp_client.post(
-                "/auth/logout",
-                headers={"Authorization": "Bearer sess_valid_token"}
-            )
+        response = mcp_client.post(
+            "/auth/logout",
+            headers={"Authorization": "Bearer sess_valid_token"}
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -204,59 +182,35 @@ class TestMCPSSEAuthentication:
     """Tests for MCP SSE endpoint authentication."""
 
     @pytest.mark.mcp
-    def test_sse_no_auth_with_api_key_configured(self, mcp_client):
-        """Test SSE access without auth when API key is configured."""
-        with patch("mcp_btc.sse_server.get_session_manager") as mock_manager:
-            mock_manager.return_value._api_key = "configured_key"
-
-            response = mcp_client.get("/sse")
-
-        assert response.status_code == 401
-        data = response.json()
-        assert "Authorization required" in data["error"]
-
-    @pytest.mark.mcp
-    def test_sse_invalid_token(self, mcp_client):
-        """Test SSE access with invalid token."""
-        with patch("mcp_btc.sse_server.validate_session_token") as mock_validate:
-            mock_validate.return_value = None
-
-            response = mcp_client.get(
-                "/sse",
-                headers={"Authorization": "Bearer invalid_token"}
-            )
+    @pytest.mark.parametrize("auth_header,error", [
+        pytest.param(None, "Authorization required", id="no-auth-with-api-key-configured"),
+        pytest.param("Bearer invalid_token", "Invalid or expired", id="invalid-token"),
+    ])
+    def test_sse_unauthorized(
+        self, mcp_client, api_key_required, invalid_session_token, auth_header, error
+    ):
+        """Test SSE access without auth or with an invalid token."""
+        headers = {"Authorization": auth_header} if auth_header else {}
+        response = mcp_client.get("/sse", headers=headers)
 
         assert response.status_code == 401
         data = response.json()
-        assert "Invalid or expired" in data["error"]
+        assert error in data["error"]
 
 
 class TestMCPMessagesAuthentication:
     """Tests for MCP messages endpoint authentication."""
 
     @pytest.mark.mcp
-    def test_messages_no_auth(self, mcp_client):
-        """Test messages endpoint without auth."""
-        with patch("mcp_btc.sse_server.get_session_manager") as mock_manager:
-            mock_manager.return_value._api_key = "configured_key"
-
-            response = mcp_client.post(
-                "/messages/",
-                json={"method": "test"}
-            )
-
-        assert response.status_code == 401
-
-    @pytest.mark.mcp
-    def test_messages_invalid_token(self, mcp_client):
-        """Test messages endpoint with invalid token."""
-        with patch("mcp_btc.sse_server.validate_session_token") as mock_validate:
-            mock_validate.return_value = None
-
-            response = mcp_client.post(
-                "/messages/",
-                headers={"Authorization": "Bearer invalid_token"},
-                json={"method": "test"}
-            )
+    @pytest.mark.parametrize("auth_header", [
+        pytest.param(None, id="no-auth"),
+        pytest.param("Bearer invalid_token", id="invalid-token"),
+    ])
+    def test_messages_unauthorized(
+        self, mcp_client, api_key_required, invalid_session_token, auth_header
+    ):
+        """Test messages endpoint without auth or with an invalid token."""
+        headers = {"Authorization": auth_header} if auth_header else {}
+        response = mcp_client.post("/messages/", headers=headers, json={"method": "test"})
 
         assert response.status_code == 401
@@ -9,18 +9,32 @@ import time
 import os
 from unittest.mock import patch, MagicMock
 
-# Ensure environment is set before importing MCP modules
-os.environ["MCP_API_KEY"] = "test_mcp_api_key_for_testing_only"
+from mcp_btc.auth import (
+    SessionManager,
+    authenticate_request,
+    get_session_manager,
+    validate_session_token,
+)
+
+# Set by tests/conftest.py (TEST_ENV) unless already configured
+MCP_API_KEY = os.environ["MCP_API_KEY"]
+
+
+@pytest.fixture(scope="module")
+def _shared_session_manager():
+    """One SessionManager instance for the whole module."""
+    return SessionManager()
 
 
 class TestSessionManager:
     """Tests for MCP SessionManager class."""
 
     @pytest.fixture
-    def session_manager(self):
-        """Create a SessionManager instance for testing."""
-        from mcp_btc.auth import SessionManager
-        return SessionManager()
+    def session_manager(self, _shared_session_manager):
+        """The shared SessionManager, emptied before each test."""
+        _shared_session_manager._sessions.clear()
+        _shared_session_manager._expiry_heap.clear()
+        return _shared_session_manager
 
     @pytest.mark.unit
     def test_create_session(self, session_manager):
@@ -93,16 +107,16 @@ class TestSessionManager:
     def test_api_key_validation(self, session_manager):
         """Test API key validation."""
         # With configured API key
-        assert session_manager.validate_api_key("test_mcp_api_key_for_testing_only") is True
+        assert session_manager.validate_api_key(MCP_API_KEY) is True
         assert session_manager.validate_api_key("wrong_key") is False
         assert session_manager.validate_api_key(None) is False
         assert session_manager.validate_api_key("") is False
+        # Non-ASCII input is rejected rather than raising
+        assert session_manager.validate_api_key("chave_inválida") is False
 
     @pytest.mark.unit
     def test_session_without_api_key(self):
         """Test manager without API key (dev mode)."""
-        from mcp_btc.auth import SessionManager
-
         # Temporarily remove API key
         original_key = os.environ.get("MCP_API_KEY")
         os.environ.pop("MCP_API_KEY", None)
@@ -126,6 +140,22 @@ class TestSessionManager:
             assert session.token not in tokens
             tokens.add(session.token)
 
+    @pytest.mark.unit
+    def test_session_tokens_not_derivable(self, session_manager):
+        """Test consecutive tokens share no prefix beyond sess_ (no prefix+counter scheme)."""
+        first = session_manager.create_session(caller_id="+5511999999999").token
+        second = session_manager.create_session(caller_id="+5511999999999").token
+
+        assert len(os.path.commonprefix([first, second])) < len("sess_") + 8
+
+    @pytest.mark.unit
+    def test_repeat_caller_strings_shared(self, session_manager):
+        """Test sessions for the same caller share one caller_id string."""
+        first = session_manager.create_session(caller_id="".join(["+5511", "999999999"]))
+        second = session_manager.create_session(caller_id="".join(["+5511", "999999999"]))
+
+        assert first.caller_id is second.caller_id
+
     @pytest.mark.unit
     def test_session_has_expiry(self, session_manager):
         """Test session has expiry time set."""
@@ -135,6 +165,24 @@ class TestSessionManager:
         assert session.expires_at > session.created_at
         assert session.expires_at > time.time()
 
+    @pytest.mark.unit
+    def test_expired_sessions_cleaned_up(self, session_manager, monkeypatch):
+        """Test expired sessions are dropped, including after an invalidation."""
+        invalidated = session_manager.create_session(caller_id="+5511111111111")
+        session_manager.create_session(caller_id="+5511222222222")
+        session_manager.invalidate_session(invalidated.token)
+        assert session_manager.get_active_sessions_count() == 1
+
+        later = time.time() + session_manager._session_expiry + 1
+        monkeypatch.setattr(time, "time", lambda: later)
+
+        assert session_manager.get_active_sessions_count() == 0
+        assert session_manager._expiry_heap == []
+
+        # New sessions after the sweep are unaffected
+        fresh = session_manager.create_session(caller_id="+5511333333333")
+        assert session_manager.get_session(fresh.token) is not None
+
 
 class TestGetSessionManager:
     """Tests for get_session_manager singleton."""
@@ -142,8 +190,6 @@ class TestGetSessionManager:
     @pytest.mark.unit
     def test_get_session_manager_returns_same_instance(self):
         """Test that get_session_manager returns singleton."""
-        from mcp_btc.auth import get_session_manager
-
         manager1 = get_session_manager()
         manager2 = get_session_manager()
 
@@ -152,8 +198,6 @@ class TestGetSessionManager:
     @pytest.mark.unit
     def test_validate_session_token_with_singleton(self):
         """Test validate_session_token uses singleton manager."""
-        from mcp_btc.auth import get_session_manager, validate_session_token
-
         # Create session using singleton manager
         manager = get_session_manager()
         session = manager.create_session(
@@ -170,8 +214,6 @@ class TestGetSessionManager:
     @pytest.mark.unit
     def test_validate_session_token_invalid(self):
         """Test validate_session_token returns None for invalid token."""
-        from mcp_btc.auth import validate_session_token
-
         result = validate_session_token("invalid_token_12345")
         assert result is None
 
@@ -183,8 +225,6 @@ class TestAuthenticateRequest:
     @pytest.mark.asyncio
     async def test_authenticate_invalid_api_key(self):
         """Test authentication with invalid API key."""
-        from mcp_btc.auth import authenticate_request
-
         success, message, session = await authenticate_request(
             api_key="invalid_key",
             caller_id="+5511999999999"
@@ -198,14 +238,12 @@ class TestAuthenticateRequest:
     @pytest.mark.asyncio
     async def test_authenticate_valid_api_key_returns_session(self):
         """Test authentication with valid API key creates session."""
-        from mcp_btc.auth import authenticate_request, get_session_manager
-
         # Get initial session count
         manager = get_session_manager()
         initial_count = manager.get_active_sessions_count()
 
         success, message, session = await authenticate_request(
-            api_key="test_mcp_api_key_for_testing_only",
+            api_key=MCP_API_KEY,
             caller_id="+5511999999999"
         )
 
@@ -0,0 +1,113 @@
+"""
+Unit tests for Beyond API client.
+
+Tests request caching behavior against a mocked HTTP transport.
+"""
+
+import httpx
+import pytest
+
+from src import beyond_api
+from src.beyond_api import BeyondAPI
+
+
+BASE_URL = "https://api.test/beyond/api/v1"
+
+
+@pytest.fixture
+def api_with_transport():
+    """BeyondAPI whose HTTP client is served by a recording mock transport."""
+    requests = []
+    clients = []
+
+    def make(handler):
+        def recording_handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        client = httpx.Client(transport=httpx.MockTransport(recording_handler))
+        clients.append(client)
+        return BeyondAPI(BASE_URL, lambda: "test-token", client=client), requests
+
+    yield make
+
+    # Injected clients stay open when the API closes; close them here
+    for client in clients:
+        client.close()
+
+
+class TestConditionalRequests:
+    """Tests for ETag / Last-Modified revalidation."""
+
+    @pytest.mark.unit
+    def test_not_modified_returns_cached_payload(self, api_with_transport):
+        """Test that a 304 response reuses the previously parsed payload."""
+        def handler(request):
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=["2025-01-10"], headers={"etag": '"v1"'})
+
+        api, requests = api_with_transport(handler)
+
+        first = api.get_available_dates(["Surf"], sport="surf")
+        second = api.get_available_dates(["Surf"], sport="surf")
+
+        assert first == second == ["2025-01-10"]
+        assert len(requests) == 2
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
+
+    @pytest.mark.unit
+    def test_no_validators_means_no_conditional_headers(self, api_with_transport):
+        """Test that responses without ETag/Last-Modified are not revalidated."""
+        api, requests = api_with_transport(lambda request: httpx.Response(200, json=[]))
+
+        api.get_available_dates(["Surf"], sport="surf")
+        api.get_available_dates(["Surf"], sport="surf")
+
+        assert "if-none-match" not in requests[1].headers
+        assert "if-modified-since" not in requests[1].headers
+
+
+class TestSessionsCache:
+    """Tests for the time-bucketed sessions cache."""
+
+    @pytest.mark.unit
+    def test_same_bucket_shares_one_request(self, api_with_transport, monkeypatch):
+        """Test that repeat calls within one time bucket hit the network once."""
+        now = [1000.0]
+        monkeypatch.setattr(beyond_api.time, "time", lambda: now[0])
+        payload = [{"id": 1, "time": "09:00", "availableSpots": 2, "totalSpots": 6, "isAvailable": True}]
+        api, requests = api_with_transport(lambda request: httpx.Response(200, json=payload))
+
+        first = api.get_sessions_for_date("2025-01-10", ["Surf"], {"level": "Iniciante1"})
+        second = api.get_sessions_for_date("2025-01-10", ["Surf"], {"level": "Iniciante1"})
+        assert len(requests) == 1
+        assert first == second
+        assert first is not second
+
+        now[0] += beyond_api.SESSIONS_CACHE_SECONDS
+        api.get_sessions_for_date("2025-01-10", ["Surf"], {"level": "Iniciante1"})
+        assert len(requests) == 2
+
+
+class TestSessionsForDates:
+    """Tests for the concurrent multi-date sessions request."""
+
+    @pytest.mark.unit
+    def test_failed_date_is_left_out(self, api_with_transport):
+        """Test that one failing date does not drop the others and order is kept."""
+        def handler(request):
+            date = request.url.params["date"]
+            if date == "2025-01-11":
+                return httpx.Response(500)
+            return httpx.Response(200, json=[{"id": date, "time": "09:00", "isAvailable": True}])
+
+        api, requests = api_with_transport(handler)
+        dates = ["2025-01-10", "2025-01-11", "2025-01-12"]
+
+        result = api.get_sessions_for_dates(dates, ["Surf"], {"level": "Iniciante1"})
+
+        assert list(result) == ["2025-01-10", "2025-01-12"]
+        assert [s.id for s in result["2025-01-12"]] == ["2025-01-12"]
+        assert len(requests) == 3
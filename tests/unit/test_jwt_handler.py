@@ -6,9 +6,10 @@ Tests token creation, validation, refresh, and expiration.
 
 import pytest
 import time
+from unittest.mock import patch
 
 from src.auth import JWTHandler
-from src.auth.jwt_handler import TokenPayload
+from src.auth.jwt_handler import TokenPayload, jwt
 
 
 class TestJWTHandler:
@@ -101,6 +102,15 @@ class TestJWTHandler:
         payload = other_handler.verify_token(valid_access_token)
         assert payload is None
 
+    @pytest.mark.unit
+    def test_tokens_interoperate_with_raw_secret(self, jwt_handler, valid_access_token, test_config):
+        """Test the prebuilt key signs and verifies like the raw secret string."""
+        claims = jwt.decode(valid_access_token, test_config["jwt_secret"], algorithms=["HS256"])
+        assert claims["user_id"] == "test-user-id-123"
+
+        token = jwt.encode(claims, test_config["jwt_secret"], algorithm="HS256")
+        assert jwt_handler.verify_token(token) is not None
+
     @pytest.mark.unit
     def test_refresh_access_token(self, jwt_handler, valid_refresh_token):
         """Test refreshing an access token."""
@@ -211,3 +221,76 @@ class TestJWTHandler:
         finally:
             if original:
                 os.environ["JWT_SECRET_KEY"] = original
+
+
+class TestVerifyCache:
+    """Tests for the verified-payload cache in verify_token."""
+
+    @pytest.mark.unit
+    def test_repeat_verify_decodes_once(self, test_config):
+        """Test the signature is checked only on the first verification."""
+        handler = JWTHandler(secret_key=test_config["jwt_secret"])
+        token = handler.create_access_token(
+            user_id="user-123",
+            phone=test_config["test_phone"],
+            auth_type="password"
+        )
+
+        with patch.object(jwt, "decode", wraps=jwt.decode) as decode:
+            payloads = [handler.verify_token(token) for _ in range(5)]
+
+        assert decode.call_count == 1
+        assert all(p.user_id == "user-123" for p in payloads)
+
+    @pytest.mark.unit
+    def test_cached_token_still_expires(self, test_config, monkeypatch):
+        """Test a cached payload is rejected once its token expires."""
+        handler = JWTHandler(secret_key=test_config["jwt_secret"])
+        token = handler.create_access_token(
+            user_id="user-123",
+            phone=test_config["test_phone"],
+            auth_type="password",
+            expires_in=60
+        )
+        assert handler.verify_token(token) is not None
+
+        later = time.time() + 120
+        monkeypatch.setattr(time, "time", lambda: later)
+
+        assert handler.verify_token(token) is None
+
+    @pytest.mark.unit
+    def test_invalid_token_not_cached(self, test_config):
+        """Test failed verifications are retried instead of cached."""
+        handler = JWTHandler(secret_key=test_config["jwt_secret"])
+
+        with patch.object(jwt, "decode", wraps=jwt.decode) as decode:
+            assert handler.verify_token("invalid.token.here") is None
+            assert handler.verify_token("invalid.token.here") is None
+
+        assert decode.call_count == 2
+
+
+class TestExpiryPrecheck:
+    """Tests for the unverified exp pre-check in the expiry helpers."""
+
+    @pytest.mark.unit
+    def test_expired_token_skips_verification(self, jwt_handler, expired_token):
+        """Test clearly expired tokens are answered without a signature check."""
+        with patch.object(jwt, "decode", wraps=jwt.decode) as decode:
+            assert jwt_handler.is_token_expired(expired_token) is True
+            assert jwt_handler.get_token_expiry(expired_token) is None
+
+        assert decode.call_count == 0
+
+    @pytest.mark.unit
+    def test_unexpired_forged_token_still_invalid(self, jwt_handler, test_config):
+        """Test a token that looks valid but has a bad signature is still rejected."""
+        forged = JWTHandler(secret_key="different_secret_key").create_access_token(
+            user_id="user-123",
+            phone=test_config["test_phone"],
+            auth_type="password"
+        )
+
+        assert jwt_handler.is_token_expired(forged) is True
+        assert jwt_handler.get_token_expiry(forged) is None
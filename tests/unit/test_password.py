@@ -83,13 +83,23 @@ class TestPasswordHandler:
     @pytest.mark.unit
     def test_needs_rehash(self, password_handler):
         """Test needs_rehash for old hashes."""
-        # Current implementation uses 12 rounds
+        # Hashes are made at the handler's configured rounds
         password = "TestPassword"
         hashed = password_handler.hash(password)
 
         # Fresh hash should not need rehash
         assert password_handler.needs_rehash(hashed) is False
 
+    @pytest.mark.unit
+    def test_production_cost(self, password_handler, password_handler_prod_cost):
+        """Test the default handler hashes at the production work factor."""
+        hashed = password_handler_prod_cost.hash("TestPassword")
+
+        assert hashed.startswith("$2b$12$")
+        assert password_handler_prod_cost.verify("TestPassword", hashed) is True
+        # Hashes made at the fast test cost would be upgraded in production
+        assert password_handler_prod_cost.needs_rehash(password_handler.hash("TestPassword")) is True
+
 
 class TestPhoneNormalization:
     """Tests for phone number normalization."""
@@ -197,3 +207,18 @@ class TestPhoneNormalization:
         for input_phone, expected in valid_phones:
             result = normalize_phone(input_phone)
             assert result == expected, f"Failed for {input_phone}"
+
+    @pytest.mark.unit
+    def test_normalize_non_ascii_separators(self):
+        """Test non-ASCII separators (e.g. no-break space) are stripped too."""
+        result = normalize_phone("+55\u00a011\u00a097274\u20111849")
+        assert result == "+5511972741849"
+
+    @pytest.mark.unit
+    def test_normalize_memoized(self):
+        """Test repeated normalization of the same number hits the cache."""
+        hits = normalize_phone.cache_info().hits
+        for _ in range(3):
+            assert normalize_phone("(11) 97274-1849") == "+5511972741849"
+
+        assert normalize_phone.cache_info().hits >= hits + 2
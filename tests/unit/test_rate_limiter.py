@@ -0,0 +1,71 @@
+"""
+Unit tests for the client-side rate limiter.
+
+Tests token-bucket accounting against a fake clock.
+"""
+
+import pytest
+
+from src import rate_limiter
+from src.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace monotonic time and sleep with a controllable clock."""
+    clock = {"now": 100.0, "sleeps": []}
+
+    def sleep(seconds):
+        clock["sleeps"].append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleep)
+    return clock
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter token bucket."""
+
+    @pytest.mark.unit
+    def test_burst_up_to_capacity_without_waiting(self, fake_clock):
+        """Test that a full bucket serves `capacity` requests immediately."""
+        limiter = RateLimiter(capacity=3, refill_per_sec=1)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert fake_clock["sleeps"] == []
+
+    @pytest.mark.unit
+    def test_waits_for_refill_when_empty(self, fake_clock):
+        """Test that an empty bucket blocks until the next token refills."""
+        limiter = RateLimiter(capacity=2, refill_per_sec=4)
+
+        with limiter:
+            pass
+        with limiter:
+            pass
+        with limiter:
+            pass
+
+        assert fake_clock["sleeps"] == [pytest.approx(0.25)]
+
+    @pytest.mark.unit
+    def test_refill_is_capped_at_capacity(self, fake_clock):
+        """Test that idle time does not accumulate more than `capacity` tokens."""
+        limiter = RateLimiter(capacity=2, refill_per_sec=1)
+        limiter.acquire()
+        fake_clock["now"] += 60
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert fake_clock["sleeps"] == [pytest.approx(1.0)]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("capacity,rate", [(0, 1), (1, 0)])
+    def test_invalid_settings_rejected(self, capacity, rate):
+        """Test that a bucket that could never serve a request is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(capacity=capacity, refill_per_sec=rate)
@@ -0,0 +1,464 @@
+"""
+Unit tests for Session Monitor.
+
+Tests session filtering and member booking flow against a fake API.
+"""
+
+import pytest
+from datetime import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+from src.beyond_api import SportSession
+from src.config import SessionConfig, SportConfig
+from src import session_monitor
+from src.session_monitor import SessionMonitor, _extract_dates
+
+
+def make_session(session_id: str, date: str, time: str, available: bool = True) -> SportSession:
+    """Build a SportSession for tests."""
+    return SportSession(
+        id=session_id,
+        sport="surf",
+        date=date,
+        time=time,
+        attributes={"level": "Iniciante1", "wave_side": "Lado_esquerdo"},
+        available_spots=2 if available else 0,
+        total_spots=6,
+        is_available=available,
+        raw_data={},
+    )
+
+
+class FakeAPI:
+    """Minimal BeyondAPI stand-in that records calls."""
+
+    def __init__(self, dates: List[str], sessions: Dict[str, List[SportSession]]):
+        self.dates = dates
+        self.sessions = sessions
+        self.dates_calls = 0
+        self.sessions_calls: List[str] = []
+        self.booked: List[str] = []
+
+    def get_available_dates(self, tags, sport="surf"):
+        self.dates_calls += 1
+        return [{"date": d} for d in self.dates]
+
+    def get_sessions_for_date(self, date, tags, attributes, sport="surf"):
+        self.sessions_calls.append(date)
+        return self.sessions.get(date, [])
+
+    def get_sessions_for_dates(self, dates, tags, attributes, sport="surf"):
+        results = {}
+        for date in dates:
+            try:
+                results[date] = self.get_sessions_for_date(date, tags, attributes, sport)
+            except Exception:
+                pass
+        return results
+
+    def book_session(self, session_id, member_id=None, sport="surf"):
+        self.booked.append(session_id)
+        return {"ok": True}
+
+
+def make_prefs(n_prefs: int = 2, target_hours=None, target_dates=None):
+    """Build member preferences with n identical session preferences."""
+    sessions = [
+        SimpleNamespace(attributes={"level": "Iniciante1", "wave_side": "Lado_esquerdo"})
+        for _ in range(n_prefs)
+    ]
+    return SimpleNamespace(
+        sessions=sessions,
+        target_hours=target_hours or [],
+        target_dates=target_dates or [],
+    )
+
+
+@pytest.fixture
+def session_config():
+    """Session config without hour/date restrictions."""
+    return SessionConfig(
+        levels=["Iniciante1"],
+        wave_sides=["Lado_esquerdo"],
+        target_hours=[],
+        target_dates=[],
+    )
+
+
+@pytest.fixture
+def fake_api():
+    """Fake API with two dates holding two open sessions each."""
+    return FakeAPI(
+        dates=["2025-01-10", "2025-01-11"],
+        sessions={
+            "2025-01-10": [
+                make_session("s1", "2025-01-10", "09:00"),
+                make_session("s2", "2025-01-10", "13:00"),
+            ],
+            "2025-01-11": [
+                make_session("s3", "2025-01-11", "09:00"),
+                make_session("s4", "2025-01-11", "15:00", available=False),
+            ],
+        },
+    )
+
+
+class TestExtractDates:
+    """Tests for the available-dates response normalizer."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("dates_data,expected", [
+        (["2025-01-10", "2025-01-11"], ["2025-01-10", "2025-01-11"]),
+        ([{"date": "2025-01-10"}, {"availableDate": "2025-01-11"}, {}], ["2025-01-10", "2025-01-11"]),
+        ({"dates": ["2025-01-10"]}, ["2025-01-10"]),
+        ({"availableDates": ["2025-01-11"]}, ["2025-01-11"]),
+        ({"dates": None, "availableDates": ["2025-01-11"]}, ["2025-01-11"]),
+        (["2025-01-10", "", 42, None, {"date": ""}], ["2025-01-10"]),
+        ({}, []),
+        (None, []),
+    ])
+    def test_extract_dates(self, dates_data, expected):
+        """Test every response shape the API is known to return."""
+        assert _extract_dates(dates_data) == expected
+
+
+class TestParseTime:
+    """Tests for session time parsing."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("time_str,expected", [
+        ("09:00", time(9, 0)),
+        ("9:05", time(9, 5)),
+        ("18:30:15", time(18, 30, 15)),
+        ("09:00 AM", time(9, 0)),
+        ("12:15 am", time(0, 15)),
+        ("12:00 PM", time(12, 0)),
+        ("03:45 PM", time(15, 45)),
+        ("24:00", None),
+        ("13:00 PM", None),
+        ("09:60", None),
+        ("", None),
+        ("noon", None),
+        (None, None),
+    ])
+    def test_parse_time(self, fake_api, session_config, time_str, expected):
+        """Test accepted formats and rejection of invalid times."""
+        monitor = SessionMonitor(fake_api, session_config)
+        assert monitor._parse_time(time_str) == expected
+
+    @pytest.mark.unit
+    def test_parse_time_is_cached(self):
+        """Test that repeated time strings are served from the parse cache."""
+        session_monitor._parse_time_cached.cache_clear()
+
+        for _ in range(3):
+            session_monitor._parse_time_cached("09:00")
+
+        info = session_monitor._parse_time_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+
+class TestFindSessionsForMember:
+    """Tests for SessionMonitor.find_sessions_for_member."""
+
+    @pytest.mark.unit
+    def test_returns_all_matches(self, fake_api, session_config):
+        """Test that every preference/date is scanned by default."""
+        monitor = SessionMonitor(
+            fake_api, session_config, get_member_preferences=lambda mid: make_prefs()
+        )
+
+        found = monitor.find_sessions_for_member(1, "Member")
+
+        assert [s.id for s in found] == ["s1", "s2", "s3", "s1", "s2", "s3"]
+        assert fake_api.dates_calls == 2
+
+    @pytest.mark.unit
+    def test_early_exit_stops_at_first_match(self, fake_api, session_config):
+        """Test that early_exit returns the first match without further requests."""
+        monitor = SessionMonitor(
+            fake_api, session_config, get_member_preferences=lambda mid: make_prefs()
+        )
+
+        found = monitor.find_sessions_for_member(1, "Member", early_exit=True)
+
+        assert [s.id for s in found] == ["s1"]
+        assert fake_api.dates_calls == 1
+
+    @pytest.mark.unit
+    def test_early_exit_skips_later_date_batches(self, session_config):
+        """Test that early_exit does not request dates past the first matching batch."""
+        dates = ["2025-01-10", "2025-01-11", "2025-01-12", "2025-01-13", "2025-01-14"]
+        api = FakeAPI(
+            dates=dates,
+            sessions={"2025-01-11": [make_session("s1", "2025-01-11", "09:00")]},
+        )
+        monitor = SessionMonitor(
+            api, session_config, get_member_preferences=lambda mid: make_prefs(n_prefs=1)
+        )
+
+        found = monitor.find_sessions_for_member(1, "Member", early_exit=True)
+
+        assert [s.id for s in found] == ["s1"]
+        assert api.sessions_calls == dates[:session_monitor.EARLY_EXIT_DATE_BATCH]
+
+    @pytest.mark.unit
+    def test_target_hours_filter(self, fake_api, session_config):
+        """Test filtering sessions by the member's target hours."""
+        monitor = SessionMonitor(
+            fake_api,
+            session_config,
+            get_member_preferences=lambda mid: make_prefs(n_prefs=1, target_hours=["13:00"]),
+        )
+
+        found = monitor.find_sessions_for_member(1, "Member")
+
+        assert [s.id for s in found] == ["s2"]
+
+
+class TestFindAvailableSessions:
+    """Tests for SessionMonitor.find_available_sessions."""
+
+    @pytest.mark.unit
+    def test_target_dates_filter(self, fake_api):
+        """Test that only configured dates are queried for sessions."""
+        config = SessionConfig(
+            levels=["Iniciante1"],
+            wave_sides=["Lado_esquerdo"],
+            target_hours=[],
+            target_dates=["2025-01-11", ""],
+        )
+        monitor = SessionMonitor(fake_api, config)
+
+        found = monitor.find_available_sessions()
+
+        assert [s.id for s in found] == ["s3"]
+        assert fake_api.sessions_calls == ["2025-01-11"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("target_hours,expected", [
+        ([], ["s1", "s2", "s3"]),
+        ([""], ["s1", "s2", "s3"]),
+        (["13:00"], ["s2"]),
+        (["09:30", "13:00"], ["s1", "s2", "s3"]),
+        (["not-a-time"], []),
+    ])
+    def test_target_hours_filter(self, fake_api, target_hours, expected):
+        """Test matching sessions against configured target hours."""
+        config = SessionConfig(
+            levels=["Iniciante1"],
+            wave_sides=["Lado_esquerdo"],
+            target_hours=target_hours,
+            target_dates=[],
+        )
+        monitor = SessionMonitor(fake_api, config)
+
+        found = monitor.find_available_sessions()
+
+        assert [s.id for s in found] == expected
+
+
+class TestMemberTargetDates:
+    """Tests for member target-date filtering."""
+
+    @pytest.mark.unit
+    def test_only_target_dates_are_queried(self, fake_api, session_config):
+        """Test that sessions are only requested for the member's target dates."""
+        monitor = SessionMonitor(
+            fake_api,
+            session_config,
+            get_member_preferences=lambda mid: make_prefs(n_prefs=1, target_dates=["2025-01-11"]),
+        )
+
+        found = monitor.find_sessions_for_member(1, "Member")
+
+        assert [s.id for s in found] == ["s3"]
+        assert fake_api.sessions_calls == ["2025-01-11"]
+
+
+class TestSearchCombos:
+    """Tests for cached global-search attribute combinations."""
+
+    @staticmethod
+    def make_sport_config(levels):
+        return SportConfig(
+            sport="surf",
+            name="Surf",
+            base_tags=["Surf", "Agendamento"],
+            options={"level": levels, "wave_side": ["Lado_esquerdo"]},
+            attribute_labels={},
+        )
+
+    @pytest.mark.unit
+    def test_combos_reused_until_sport_config_changes(self, fake_api, session_config):
+        """Test that combos survive equal configs and are rebuilt for new ones."""
+        monitor = SessionMonitor(
+            fake_api, session_config, sport_config=self.make_sport_config(["Iniciante1"])
+        )
+
+        combos = list(monitor._get_search_combos())
+        assert combos == [(
+            {"level": "Iniciante1", "wave_side": "Lado_esquerdo"},
+            ("Surf", "Agendamento", "Iniciante1", "Lado_esquerdo"),
+            "Iniciante1 / Lado_esquerdo",
+        )]
+
+        # The bot reloads an equal SportConfig before every check
+        cached = monitor._combos
+        monitor.sport_config = self.make_sport_config(["Iniciante1"])
+        assert list(monitor._get_search_combos()) == combos
+        assert monitor._combos is cached
+
+        monitor.sport_config = self.make_sport_config(["Iniciante2"])
+        assert [c[0]["level"] for c in monitor._get_search_combos()] == ["Iniciante2"]
+        assert monitor._combos is not cached
+
+
+class TestRunCheckForMembers:
+    """Tests for SessionMonitor.run_check_for_members."""
+
+    @pytest.mark.unit
+    def test_books_first_match(self, fake_api, session_config):
+        """Test that the highest-priority session is booked."""
+        monitor = SessionMonitor(
+            fake_api, session_config, get_member_preferences=lambda mid: make_prefs()
+        )
+
+        results = monitor.run_check_for_members([{"member_id": 1, "social_name": "Member"}])
+
+        assert len(results) == 1
+        assert results[0].success is True
+        assert fake_api.booked == ["s1"]
+
+    @pytest.mark.unit
+    def test_concurrent_search_books_in_member_order(self, fake_api, session_config):
+        """Test that bookings follow the members list despite concurrent searches."""
+        hours = {1: ["13:00"], 2: ["09:00"], 3: ["18:00"]}
+        monitor = SessionMonitor(
+            fake_api,
+            session_config,
+            get_member_preferences=lambda mid: make_prefs(n_prefs=1, target_hours=hours[mid]),
+        )
+        members = [{"member_id": mid, "social_name": f"M{mid}"} for mid in hours]
+
+        results = monitor.run_check_for_members(members)
+
+        assert [r.member_id for r in results] == [1, 2]
+        assert fake_api.booked == ["s2", "s1"]
+        assert monitor.last_report.sessions_found == 2
+
+    @pytest.mark.unit
+    def test_report_counts_sessions_like_run_check(self, fake_api, session_config):
+        """Test that the report counts matching sessions, not members with matches."""
+        monitor = SessionMonitor(
+            fake_api, session_config, get_member_preferences=lambda mid: make_prefs(n_prefs=1)
+        )
+
+        monitor.run_check_for_members([{"member_id": 1, "social_name": "Member"}], auto_book=False)
+        member_count = monitor.last_report.sessions_found
+        monitor.run_check(auto_book=False)
+
+        assert member_count == monitor.last_report.sessions_found == 3
+
+    @pytest.mark.unit
+    def test_repeated_member_is_handled_once(self, fake_api, session_config):
+        """Test that a member listed twice is searched and booked once."""
+        calls = []
+
+        def get_prefs(mid):
+            calls.append(mid)
+            return make_prefs(n_prefs=1)
+
+        monitor = SessionMonitor(fake_api, session_config, get_member_preferences=get_prefs)
+        member = {"member_id": 1, "social_name": "Member"}
+
+        results = monitor.run_check_for_members([member, member])
+
+        assert calls == [1]
+        assert len(results) == 1
+        assert fake_api.booked == ["s1"]
+
+
+class TestRunCache:
+    """Tests for per-run caching of dates/sessions lookups."""
+
+    @pytest.mark.unit
+    def test_members_share_lookups_within_run(self, fake_api, session_config):
+        """Test that identical lookups in one run hit the API once."""
+        monitor = SessionMonitor(
+            fake_api, session_config, get_member_preferences=lambda mid: make_prefs()
+        )
+        members = [
+            {"member_id": 1, "social_name": "One"},
+            {"member_id": 2, "social_name": "Two"},
+        ]
+
+        monitor.run_check_for_members(members, auto_book=False)
+
+        assert fake_api.dates_calls == 1
+        assert sorted(fake_api.sessions_calls) == ["2025-01-10", "2025-01-11"]
+
+    @pytest.mark.unit
+    def test_cache_is_dropped_between_runs(self, fake_api, session_config):
+        """Test that each run starts with fresh lookups."""
+        monitor = SessionMonitor(fake_api, session_config)
+
+        monitor.run_check(auto_book=False)
+        monitor.run_check(auto_book=False)
+
+        assert fake_api.dates_calls == 2
+        assert monitor._dates_cache is None
+
+
+class TestBookedHistory:
+    """Tests for the bounded booked-session history."""
+
+    @pytest.mark.unit
+    def test_booked_history_is_bounded(self, fake_api, session_config, monkeypatch):
+        """Test that the oldest booked session IDs are evicted on overflow."""
+        monkeypatch.setattr(session_monitor, "MAX_BOOKED_HISTORY", 2)
+        monitor = SessionMonitor(fake_api, session_config)
+
+        for session_id in ("a", "b", "c"):
+            monitor._add_booked(session_id, member_id=1)
+
+        assert monitor.get_booked_sessions() == {"b", "c"}
+        assert list(monitor._member_booked[1]) == ["b", "c"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("bloom_min_booked", [1024, 0])
+    def test_booked_sessions_are_skipped(self, fake_api, session_config, monkeypatch, bloom_min_booked):
+        """Test that booked sessions are filtered out with and without the Bloom pre-check."""
+        monkeypatch.setattr(session_monitor, "BLOOM_MIN_BOOKED", bloom_min_booked)
+        monitor = SessionMonitor(fake_api, session_config)
+        monitor._add_booked("s1")
+
+        found = monitor.find_available_sessions()
+
+        assert [s.id for s in found] == ["s2", "s3"]
+
+
+class TestCheckReport:
+    """Tests for polling backoff reporting."""
+
+    @pytest.mark.unit
+    def test_backoff_grows_while_empty_and_resets(self, session_config):
+        """Test that empty checks widen the interval up to the cap."""
+        api = FakeAPI(dates=[], sessions={})
+        monitor = SessionMonitor(api, session_config, base_interval=10)
+
+        intervals = []
+        for _ in range(6):
+            monitor.run_check()
+            intervals.append(monitor.last_report.suggested_next_interval)
+
+        assert intervals == [20, 40, 80, 160, 160, 160]
+
+        api.dates = ["2025-01-10"]
+        api.sessions = {"2025-01-10": [make_session("s1", "2025-01-10", "09:00")]}
+        monitor.run_check(auto_book=False)
+
+        assert monitor.last_report.sessions_found == 1
+        assert monitor.last_report.suggested_next_interval == 10
@@ -4,10 +4,16 @@ Unit tests for User Store.
 Tests user CRUD operations and persistence.
 """
 
+import os
+import time
+import uuid
+import orjson
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.auth import UserStore, User
+from src.auth.users import _new_user_id
 
 
 class TestUserStore:
@@ -28,6 +34,17 @@ class TestUserStore:
         assert user.is_active is True
         assert user.user_id is not None
 
+    @pytest.mark.unit
+    def test_user_ids_time_ordered(self):
+        """Test user IDs are UUIDv7 strings that sort by creation time."""
+        with patch.object(time, "time_ns", return_value=1_700_000_000_000_000_000):
+            earlier = _new_user_id()
+        later = _new_user_id()
+
+        assert uuid.UUID(earlier).version == 7
+        assert uuid.UUID(earlier).variant == uuid.RFC_4122
+        assert earlier < later
+
     @pytest.mark.unit
     def test_create_user_without_password(self, user_store, test_config):
         """Test creating user without password (phone-only auth)."""
@@ -79,11 +96,10 @@ class TestUserStore:
         assert user is None
 
     @pytest.mark.unit
-    def test_persistence(self, temp_user_file, test_config):
+    def test_persistence(self, user_store, temp_user_file, test_config):
         """Test that data persists to file."""
         # Create user with first store instance
-        store1 = UserStore(file_path=temp_user_file)
-        user = store1.create_user(
+        user = user_store.create_user(
             phone=test_config["test_phone"],
             password=test_config["test_password"],
             name=test_config["test_user_name"]
@@ -133,14 +149,25 @@ class TestUserStore:
     @pytest.mark.unit
     def test_list_users(self, user_store, test_config):
         """Test listing all users."""
-        # Create multiple users
-        user_store.create_user(phone="+5511111111111", name="User 1")
-        user_store.create_user(phone="+5511222222222", name="User 2")
-        user_store.create_user(phone="+5511333333333", name="User 3")
+        # Create multiple users in one write
+        user_store.create_users([
+            {"phone": "+5511111111111", "name": "User 1"},
+            {"phone": "+5511222222222", "name": "User 2"},
+            {"phone": "+5511333333333", "name": "User 3"},
+        ])
 
         users = user_store.list_users()
         assert len(users) == 3
 
+    @pytest.mark.unit
+    def test_create_users_rejects_whole_batch(self, user_store, sample_user, test_config):
+        """Test one invalid or duplicate entry leaves the store unchanged."""
+        for bad in ({"phone": "invalid"}, {"phone": test_config["test_phone"]}, {"phone": "+5511111111111"}):
+            with pytest.raises(ValueError):
+                user_store.create_users([{"phone": "+5511111111111"}, bad])
+
+        assert [u.phone for u in user_store.list_users()] == [sample_user.phone]
+
     @pytest.mark.unit
     def test_user_with_member_ids(self, user_store, test_config):
         """Test creating user with member IDs."""
@@ -161,3 +188,61 @@ class TestUserStore:
                 phone="invalid",
                 name="Test User"
             )
+
+    @pytest.mark.unit
+    def test_unchanged_file_not_reparsed(self, user_store, sample_user, test_config):
+        """Test repeated lookups reuse the parsed file until it changes."""
+        with patch("src.auth.users.orjson.loads", wraps=orjson.loads) as load:
+            for _ in range(3):
+                assert user_store.get_by_phone(test_config["test_phone"]) is not None
+            assert user_store.get_by_id(sample_user.user_id) is not None
+
+        assert load.call_count == 0
+
+    @pytest.mark.unit
+    def test_sees_changes_from_other_store(self, user_store, temp_user_file, sample_user):
+        """Test writes through another store (e.g. another process) are picked up."""
+        user_store.get_by_phone(sample_user.phone)
+
+        other = UserStore(file_path=temp_user_file)
+        other.link_member(sample_user.phone, 12345)
+
+        assert user_store.get_by_phone(sample_user.phone).member_ids == [12345]
+
+    @pytest.mark.unit
+    def test_sees_same_size_rewrite_within_mtime_tick(self, user_store, temp_user_file, sample_user):
+        """Test a same-size rewrite that keeps the old mtime is still picked up."""
+        other = UserStore(file_path=temp_user_file)
+        other.record_login(sample_user.phone)
+        before = user_store.get_by_phone(sample_user.phone)
+        stat = temp_user_file.stat()
+
+        with patch("src.auth.users.datetime") as fake_datetime:
+            fake_datetime.utcnow.return_value.isoformat.return_value = "2030-01-01T00:00:00.000001"
+            other.record_login(sample_user.phone)
+        os.utime(temp_user_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert temp_user_file.stat().st_size == stat.st_size
+        after = user_store.get_by_phone(sample_user.phone)
+        assert after.last_login == "2030-01-01T00:00:00.000001" != before.last_login
+
+    @pytest.mark.unit
+    def test_failed_save_leaves_cache_unchanged(self, user_store, sample_user):
+        """Test users from a failed save are never visible to readers."""
+        with patch("src.auth.users.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                user_store.create_user(phone="+5511111111111", name="Unsaved")
+
+        assert user_store.get_by_phone("+5511111111111") is None
+        assert [u.phone for u in user_store.list_users()] == [sample_user.phone]
+        assert [p.name for p in user_store.file_path.parent.iterdir()] == ["users.json"]
+
+    @pytest.mark.unit
+    def test_save_keeps_file_mode(self, user_store, temp_user_file):
+        """Test replacing the file on save keeps its permissions."""
+        os.chmod(temp_user_file, 0o600)
+
+        user_store.create_user(phone="+5511111111111", name="User 1")
+
+        assert temp_user_file.stat().st_mode & 0o777 == 0o600
+